@@ -73,7 +73,7 @@ def _parse_api_error(status_code: int, response_text: str) -> Dict[str, Any]:
     template = _ERROR_TEMPLATES.get(status_code, {})
     if template:
         result["message"] = f"{template.get('title', 'Error')} (HTTP {status_code})"
-        result["suggestions"] = template.get("suggestions", [])
+        result["suggestions"] = list(template.get("suggestions", []))
 
     # Try to parse JSON response
     try:
@@ -221,7 +221,18 @@ class MealieClient:
         }
 
         # Create synchronous HTTP client
-        self.client = httpx.Client(
+        self.client = self._build_client()
+
+    def _build_client(self) -> httpx.Client:
+        """
+        Create the underlying httpx client.
+
+        Kept separate from __init__ so tests can substitute a shared transport.
+
+        Returns:
+            httpx.Client configured with auth headers and timeout
+        """
+        return httpx.Client(
             headers=self.headers,
             timeout=self.TIMEOUT,
             follow_redirects=True,
@@ -11,6 +11,17 @@ from pathlib import Path
 from typing import Any, Optional
 
 
+def _dumps_tool_result(result: Any) -> str:
+    """Serialize a tool result, reporting a serialization failure as an error payload."""
+    try:
+        return json.dumps(result, indent=2)
+    except Exception as e:
+        error_result = {
+            "error": f"Unexpected error: {str(e)}"
+        }
+        return json.dumps(error_result, indent=2)
+
+
 def _slugify(text: str) -> str:
     """Convert text to a slug (lowercase, hyphens for spaces, no special chars)."""
     text = text.lower().strip()
@@ -44,6 +55,16 @@ def recipes_search(
     Returns:
         JSON string with list of matching recipes (name, slug, description, tags)
     """
+    return _dumps_tool_result(_recipes_search_impl(query, tags, categories, limit))
+
+
+def _recipes_search_impl(
+    query: str = "",
+    tags: Optional[list[str]] = None,
+    categories: Optional[list[str]] = None,
+    limit: int = 10
+) -> Any:
+    """Search for recipes; returns the recipes_search payload before serialization."""
     try:
         with MealieClient() as client:
             # Build query parameters
@@ -82,10 +103,10 @@ def recipes_search(
                     "count": len(recipes),
                     "recipes": recipes
                 }
-                return json.dumps(result, indent=2)
+                return result
 
             # If response doesn't match expected format, return as-is
-            return json.dumps(response, indent=2)
+            return response
 
     except MealieAPIError as e:
         error_result = {
@@ -93,12 +114,12 @@ def recipes_search(
             "status_code": e.status_code,
             "response_body": e.response_body
         }
-        return json.dumps(error_result, indent=2)
+        return error_result
     except Exception as e:
         error_result = {
             "error": f"Unexpected error: {str(e)}"
         }
-        return json.dumps(error_result, indent=2)
+        return error_result
 
 
 def recipes_get(slug: str) -> str:
@@ -110,13 +131,18 @@ def recipes_get(slug: str) -> str:
     Returns:
         JSON string with full recipe details including ingredients, instructions, nutrition
     """
+    return _dumps_tool_result(_recipes_get_impl(slug))
+
+
+def _recipes_get_impl(slug: str) -> Any:
+    """Fetch a recipe; returns the recipes_get payload before serialization."""
     try:
         with MealieClient() as client:
             # Make API request
             response = client.get(f"/api/recipes/{slug}")
 
             # Return full recipe data
-            return json.dumps(response, indent=2)
+            return response
 
     except MealieAPIError as e:
         error_result = {
@@ -124,12 +150,12 @@ def recipes_get(slug: str) -> str:
             "status_code": e.status_code,
             "response_body": e.response_body
         }
-        return json.dumps(error_result, indent=2)
+        return error_result
     except Exception as e:
         error_result = {
             "error": f"Unexpected error: {str(e)}"
         }
-        return json.dumps(error_result, indent=2)
+        return error_result
 
 
 def recipes_list(page: int = 1, per_page: int = 20) -> str:
@@ -142,6 +168,11 @@ def recipes_list(page: int = 1, per_page: int = 20) -> str:
     Returns:
         JSON string with paginated recipe list and metadata
     """
+    return _dumps_tool_result(_recipes_list_impl(page, per_page))
+
+
+def _recipes_list_impl(page: int = 1, per_page: int = 20) -> Any:
+    """List recipes; returns the recipes_list payload before serialization."""
     try:
         with MealieClient() as client:
             # Build query parameters
@@ -162,10 +193,10 @@ def recipes_list(page: int = 1, per_page: int = 20) -> str:
                     "total_pages": response.get("totalPages", 0),
                     "items": response.get("items", [])
                 }
-                return json.dumps(result, indent=2)
+                return result
 
             # If response doesn't match expected format, return as-is
-            return json.dumps(response, indent=2)
+            return response
 
     except MealieAPIError as e:
         error_result = {
@@ -173,12 +204,12 @@ def recipes_list(page: int = 1, per_page: int = 20) -> str:
             "status_code": e.status_code,
             "response_body": e.response_body
         }
-        return json.dumps(error_result, indent=2)
+        return error_result
     except Exception as e:
         error_result = {
             "error": f"Unexpected error: {str(e)}"
         }
-        return json.dumps(error_result, indent=2)
+        return error_result
 
 
 def _resolve_tags(
@@ -3,12 +3,14 @@ Shared pytest fixtures for Mealie MCP tests.
 
 Provides common test fixtures for mocking HTTP clients and API responses.
 
+The sample_* data fixtures are session-scoped and shared between tests:
+treat them as read-only and copy before modifying.
+
 For unit test-specific fixtures (isolated mocks, builders), see tests/unit/conftest.py.
 For mock data builders, see tests/unit/builders.py.
 """
 
 import pytest
-import respx
 from httpx import Response
 from src.client import MealieClient
 from tests.unit.builders import (
@@ -40,12 +42,17 @@ def respx_mock():
 
     Use this for integration tests that need to mock HTTP responses.
     For pure unit tests without HTTP, use mock_client_isolated instead.
+
+    respx is imported here rather than at module level so test runs that
+    never request this fixture don't pay for importing it.
     """
+    import respx
+
     with respx.mock:
         yield respx
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_recipe():
     """Sample recipe data for testing.
 
@@ -58,7 +65,7 @@ def sample_recipe():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_mealplan():
     """Sample meal plan entry for testing.
 
@@ -74,7 +81,7 @@ def sample_mealplan():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_shopping_list():
     """Sample shopping list for testing.
 
@@ -96,7 +103,7 @@ def sample_shopping_list():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_tag():
     """Sample tag for testing.
 
@@ -109,7 +116,7 @@ def sample_tag():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_category():
     """Sample category for testing.
 
@@ -0,0 +1,17 @@
+"""JSON decoding for unit test assertions.
+
+Tool functions return JSON strings, so most tests decode every result. Uses
+orjson when installed and falls back to the stdlib parser otherwise; both
+accept ``str`` and ``bytes``.
+
+Usage:
+    >>> from tests.unit._json import loads
+    >>> result_dict = loads(recipes_search(query="pasta"))
+"""
+
+try:
+    from orjson import loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    from json import loads
+
+__all__ = ["loads"]
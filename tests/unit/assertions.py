@@ -9,7 +9,8 @@ Usage:
     >>> assert_recipe_structure(recipe)  # Passes
 """
 
-from typing import Dict, Any, List
+from datetime import datetime
+from typing import Dict, Any, Iterable, List
 
 
 def assert_valid_uuid(value: str) -> None:
@@ -46,7 +47,6 @@ def assert_valid_iso_date(value: str) -> None:
         >>> assert_valid_iso_date("2025-12-25T10:30:00Z")
         >>> assert_valid_iso_date("invalid-date")  # Raises AssertionError
     """
-    from datetime import datetime
     try:
         # Handle both with and without timezone
         datetime.fromisoformat(value.replace("Z", "+00:00"))
@@ -54,12 +54,12 @@ def assert_valid_iso_date(value: str) -> None:
         raise AssertionError(f"{value} is not a valid ISO 8601 date")
 
 
-def assert_has_keys(obj: Dict[str, Any], required_keys: List[str]) -> None:
+def assert_has_keys(obj: Dict[str, Any], required_keys: Iterable[str]) -> None:
     """Assert dictionary has all required keys.
 
     Args:
         obj: Dictionary to check
-        required_keys: List of keys that must be present
+        required_keys: Keys that must be present
 
     Raises:
         AssertionError: If any required keys are missing
@@ -69,7 +69,7 @@ def assert_has_keys(obj: Dict[str, Any], required_keys: List[str]) -> None:
         >>> assert_has_keys(obj, ["id", "name"])
         >>> assert_has_keys(obj, ["id", "missing"])  # Raises AssertionError
     """
-    missing = set(required_keys) - set(obj.keys())
+    missing = {key for key in required_keys if key not in obj}
     if missing:
         raise AssertionError(f"Missing required keys: {missing}")
 
@@ -89,7 +89,7 @@ def assert_recipe_structure(recipe: Dict[str, Any]) -> None:
         >>> recipe = build_recipe()
         >>> assert_recipe_structure(recipe)
     """
-    assert_has_keys(recipe, ["id", "slug", "name"])
+    assert_has_keys(recipe, ("id", "slug", "name"))
 
     if "tags" in recipe:
         assert isinstance(recipe["tags"], list), "tags must be a list"
@@ -119,7 +119,7 @@ def assert_mealplan_structure(mealplan: Dict[str, Any]) -> None:
         >>> mealplan = build_mealplan()
         >>> assert_mealplan_structure(mealplan)
     """
-    assert_has_keys(mealplan, ["id", "date", "entryType"])
+    assert_has_keys(mealplan, ("id", "date", "entryType"))
 
     valid_entry_types = ["breakfast", "lunch", "dinner", "side", "snack"]
     assert mealplan["entryType"] in valid_entry_types, \
@@ -139,7 +139,7 @@ def assert_shopping_list_structure(shopping_list: Dict[str, Any]) -> None:
         >>> shopping_list = build_shopping_list()
         >>> assert_shopping_list_structure(shopping_list)
     """
-    assert_has_keys(shopping_list, ["id", "name"])
+    assert_has_keys(shopping_list, ("id", "name"))
 
     if "listItems" in shopping_list:
         assert isinstance(shopping_list["listItems"], list), "listItems must be a list"
@@ -158,7 +158,7 @@ def assert_tag_structure(tag: Dict[str, Any]) -> None:
         >>> tag = build_tag()
         >>> assert_tag_structure(tag)
     """
-    assert_has_keys(tag, ["id", "name", "slug"])
+    assert_has_keys(tag, ("id", "name", "slug"))
 
 
 def assert_category_structure(category: Dict[str, Any]) -> None:
@@ -174,7 +174,7 @@ def assert_category_structure(category: Dict[str, Any]) -> None:
         >>> category = build_category()
         >>> assert_category_structure(category)
     """
-    assert_has_keys(category, ["id", "name", "slug"])
+    assert_has_keys(category, ("id", "name", "slug"))
 
 
 def assert_tool_structure(tool: Dict[str, Any]) -> None:
@@ -190,7 +190,7 @@ def assert_tool_structure(tool: Dict[str, Any]) -> None:
         >>> tool = build_tool()
         >>> assert_tool_structure(tool)
     """
-    assert_has_keys(tool, ["id", "name", "slug"])
+    assert_has_keys(tool, ("id", "name", "slug"))
 
 
 def assert_food_structure(food: Dict[str, Any]) -> None:
@@ -206,7 +206,7 @@ def assert_food_structure(food: Dict[str, Any]) -> None:
         >>> food = build_food()
         >>> assert_food_structure(food)
     """
-    assert_has_keys(food, ["id", "name"])
+    assert_has_keys(food, ("id", "name"))
 
 
 def assert_unit_structure(unit: Dict[str, Any]) -> None:
@@ -222,7 +222,7 @@ def assert_unit_structure(unit: Dict[str, Any]) -> None:
         >>> unit = build_unit()
         >>> assert_unit_structure(unit)
     """
-    assert_has_keys(unit, ["id", "name"])
+    assert_has_keys(unit, ("id", "name"))
 
 
 def assert_cookbook_structure(cookbook: Dict[str, Any]) -> None:
@@ -238,7 +238,7 @@ def assert_cookbook_structure(cookbook: Dict[str, Any]) -> None:
         >>> cookbook = build_cookbook()
         >>> assert_cookbook_structure(cookbook)
     """
-    assert_has_keys(cookbook, ["id", "name", "slug"])
+    assert_has_keys(cookbook, ("id", "name", "slug"))
 
     if "recipes" in cookbook:
         assert isinstance(cookbook["recipes"], list), "recipes must be a list"
@@ -257,7 +257,7 @@ def assert_comment_structure(comment: Dict[str, Any]) -> None:
         >>> comment = build_comment()
         >>> assert_comment_structure(comment)
     """
-    assert_has_keys(comment, ["id", "recipeId", "text"])
+    assert_has_keys(comment, ("id", "recipeId", "text"))
 
 
 def assert_timeline_event_structure(event: Dict[str, Any]) -> None:
@@ -273,7 +273,7 @@ def assert_timeline_event_structure(event: Dict[str, Any]) -> None:
         >>> event = build_timeline_event()
         >>> assert_timeline_event_structure(event)
     """
-    assert_has_keys(event, ["id", "recipeId", "subject", "eventType"])
+    assert_has_keys(event, ("id", "recipeId", "subject", "eventType"))
 
     valid_event_types = ["system", "info", "comment"]
     assert event["eventType"] in valid_event_types, \
@@ -293,7 +293,7 @@ def assert_parsed_ingredient_structure(parsed: Dict[str, Any]) -> None:
         >>> parsed = build_parsed_ingredient()
         >>> assert_parsed_ingredient_structure(parsed)
     """
-    assert_has_keys(parsed, ["input", "ingredient", "confidence"])
+    assert_has_keys(parsed, ("input", "ingredient", "confidence"))
 
     # Check ingredient substructure
     ingredient = parsed["ingredient"]
@@ -13,6 +13,11 @@ from datetime import datetime, UTC
 from typing import Dict, Any, List
 
 
+def _utc_now_iso() -> str:
+    """Current UTC time as an ISO 8601 string with a Z suffix."""
+    return datetime.now(UTC).isoformat().replace("+00:00", "Z")
+
+
 def build_recipe(
     slug: str = "test-recipe",
     name: str = "Test Recipe",
@@ -35,6 +40,7 @@ def build_recipe(
         >>> recipe["recipeYield"]
         '6 servings'
     """
+    now = _utc_now_iso()
     recipe = {
         "id": f"recipe-{slug}",
         "slug": slug,
@@ -52,8 +58,8 @@ def build_recipe(
         "tags": [{"id": "tag-1", "name": "Dinner", "slug": "dinner"}],
         "recipeCategory": [{"id": "cat-1", "name": "Main", "slug": "main"}],
         "groupId": "group-123",
-        "dateAdded": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
-        "dateUpdated": datetime.now(UTC).isoformat().replace("+00:00", "Z")
+        "dateAdded": now,
+        "dateUpdated": now
     }
     recipe.update(overrides)
     return recipe
@@ -360,13 +366,14 @@ def build_comment(
         >>> comment["text"]
         'This was delicious!'
     """
+    now = _utc_now_iso()
     comment = {
         "id": "comment-123",
         "recipeId": recipe_id,
         "text": text,
         "userId": "user-123",
-        "createdAt": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
-        "updatedAt": datetime.now(UTC).isoformat().replace("+00:00", "Z")
+        "createdAt": now,
+        "updatedAt": now
     }
     comment.update(overrides)
     return comment
@@ -398,7 +405,7 @@ def build_timeline_event(
         "subject": subject,
         "eventType": "info",
         "eventMessage": "Test event message",
-        "timestamp": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
+        "timestamp": _utc_now_iso(),
         "userId": "user-123"
     }
     event.update(overrides)
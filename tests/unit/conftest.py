@@ -10,36 +10,115 @@ in isolation without external dependencies (no real HTTP calls, no Docker, no MC
 
 import pytest
 import httpx
-from typing import Generator, Dict, Any
-from unittest.mock import Mock, MagicMock, patch
+from pathlib import Path
+from typing import Any, Callable, Dict, Generator, List
+from unittest.mock import Mock, MagicMock, create_autospec, patch
 from src.client import MealieClient
+from tests.unit.builders import (
+    build_category,
+    build_recipe,
+    build_shopping_item,
+    build_shopping_list,
+    build_tag,
+)
+
+
+_UNIT_DIR = Path(__file__).parent
+
+
+def pytest_collection_modifyitems(items: List[pytest.Item]) -> None:
+    """Mark every test collected from tests/unit as ``unit``, so ``-m unit`` selects them all."""
+    for item in items:
+        if _UNIT_DIR in item.path.parents:
+            item.add_marker(pytest.mark.unit)
+
+
+class _SharedHTTPTransport(httpx.HTTPTransport):
+    """HTTPTransport that outlives the clients built on it.
+
+    httpx.Client.close() closes its transport; this one ignores that so one
+    client closing cannot break the others. The owning fixture calls
+    close_pool() at teardown.
+    """
+
+    def close(self) -> None:
+        pass
+
+    def close_pool(self) -> None:
+        super().close()
+
+
+@pytest.fixture(scope="package")
+def use_shared_transport() -> Generator[Callable[[MealieClient], MealieClient], None, None]:
+    """
+    Rewire MealieClients onto one shared plain HTTP/1.1 transport (opt-in).
+
+    For respx-mocked modules: their requests never leave the process, so a
+    per-client transport (SSL context, connection pool) is wasted setup.
+    MealieClient is still constructed normally, so _build_client keeps its
+    production behavior everywhere else, including initialization tests.
+
+    Returns:
+        Function that swaps a MealieClient's httpx client for one on the
+        shared transport and returns the MealieClient
+
+    Example:
+        @pytest.fixture(scope="module")
+        def client(use_shared_transport):
+            mealie = use_shared_transport(MealieClient("http://test", "token"))
+            yield mealie
+            mealie.close()
+    """
+    transport = _SharedHTTPTransport(http2=False, limits=httpx.Limits(max_connections=1))
+
+    def attach(mealie: MealieClient) -> MealieClient:
+        mealie.client.close()
+        mealie.client = httpx.Client(
+            headers=mealie.headers,
+            timeout=mealie.TIMEOUT,
+            follow_redirects=True,
+            transport=transport,
+        )
+        return mealie
+
+    yield attach
+    transport.close_pool()
+
+
+@pytest.fixture(scope="session")
+def _session_httpx_client() -> MagicMock:
+    """One MagicMock httpx.Client for the session; handed out by mock_httpx_client."""
+    return MagicMock(spec=httpx.Client)
 
 
 @pytest.fixture
-def mock_httpx_client() -> Generator[Mock, None, None]:
+def mock_httpx_client(_session_httpx_client: MagicMock) -> Mock:
     """
     Create a mock httpx.Client for testing without real HTTP calls.
 
+    The session's mock is reused; its configured responses and call history
+    are wiped each time a test requests it.
+
     Returns:
         Mock httpx.Client instance
 
     Example:
-        def test_get_recipe(mock_httpx_client):
-            mock_httpx_client.get.return_value.json.return_value = {"name": "Test Recipe"}
-            mock_httpx_client.get.return_value.status_code = 200
+        def test_get(mock_httpx_client):
+            mock_httpx_client.request.return_value.json.return_value = {"name": "Test Recipe"}
+            mock_httpx_client.request.return_value.status_code = 200
 
             client = MealieClient("http://test", "token")
             client.client = mock_httpx_client
 
-            recipe = client.get_recipe("test-recipe")
+            recipe = client.get("/api/recipes/test-recipe")
             assert recipe["name"] == "Test Recipe"
     """
-    mock_client = MagicMock(spec=httpx.Client)
-    yield mock_client
+    _session_httpx_client.reset_mock(return_value=True, side_effect=True)
+    return _session_httpx_client
 
 
 @pytest.fixture
-def mock_mealie_client(mock_httpx_client: Mock) -> MealieClient:
+def mock_mealie_client(mock_httpx_client: Mock) -> Generator[MealieClient, None, None]:
     """
     Create a MealieClient with mocked httpx.Client.
 
@@ -55,22 +134,130 @@ def mock_mealie_client(mock_httpx_client: Mock) -> MealieClient:
     Example:
         def test_client_method(mock_mealie_client, mock_httpx_client):
             # Configure mock response
-            mock_httpx_client.get.return_value.json.return_value = {"name": "Test"}
-            mock_httpx_client.get.return_value.status_code = 200
+            mock_httpx_client.request.return_value.json.return_value = {"name": "Test"}
+            mock_httpx_client.request.return_value.status_code = 200
 
             # Test client method
-            result = mock_mealie_client.get_recipe("test-slug")
+            result = mock_mealie_client.get("/api/recipes/test-slug")
 
             # Verify
             assert result["name"] == "Test"
-            mock_httpx_client.get.assert_called_once()
+            mock_httpx_client.request.assert_called_once()
     """
     client = MealieClient(
         base_url="http://test.example.com",
         api_token="test-token-12345"
     )
+    client.client.close()
     client.client = mock_httpx_client
-    return client
+    yield client
+
+
+@pytest.fixture(scope="session")
+def multiple_recipes() -> List[Dict[str, Any]]:
+    """
+    Three distinct recipes for list-handling tests (read-only, shared).
+
+    Returns:
+        List of recipe dicts with unique slugs
+    """
+    return [
+        build_recipe(slug=f"recipe-{i}", name=f"Recipe {i}")
+        for i in range(1, 4)
+    ]
+
+
+@pytest.fixture(scope="session")
+def recipe_with_tags() -> Dict[str, Any]:
+    """
+    Recipe with description, two tags and a category (read-only, shared).
+
+    Returns:
+        Recipe dict tagged Quick and Easy in the Dinner category
+    """
+    return build_recipe(
+        name="Test Recipe",
+        slug="test-recipe",
+        description="A test recipe",
+        tags=[build_tag(name="Quick"), build_tag(name="Easy")],
+        recipeCategory=[build_category(name="Dinner")]
+    )
+
+
+@pytest.fixture(scope="session")
+def shopping_list_with_items() -> Dict[str, Any]:
+    """
+    Shopping list holding three items (read-only, shared).
+
+    Returns:
+        Shopping list dict with populated listItems
+    """
+    return build_shopping_list(
+        name="Weekly Groceries",
+        listItems=[
+            build_shopping_item(id=f"item-{i}", note=note)
+            for i, note in enumerate(["2 cups flour", "1 dozen eggs", "1 lb butter"], start=1)
+        ]
+    )
+
+
+@pytest.fixture(scope="session")
+def recipe_with_full_details() -> Dict[str, Any]:
+    """
+    Recipe with every list field populated (read-only, shared).
+
+    Returns:
+        Recipe dict with 5 ingredients, 5 instructions, 2 tags and 2 categories
+    """
+    return build_recipe(
+        slug="full-recipe",
+        name="Full Recipe",
+        recipeIngredient=[
+            "2 cups flour", "1 tsp salt", "1 cup water", "2 tbsp olive oil", "1 tsp yeast"
+        ],
+        recipeInstructions=[
+            {"text": "Mix dry ingredients"},
+            {"text": "Add water and oil"},
+            {"text": "Knead for 10 minutes"},
+            {"text": "Let rise for 1 hour"},
+            {"text": "Bake at 450F for 25 minutes"}
+        ],
+        tags=[build_tag(name="Bread"), build_tag(name="Vegan")],
+        recipeCategory=[build_category(name="Baking"), build_category(name="Side")]
+    )
+
+
+@pytest.fixture(scope="session")
+def _mealie_client_autospec() -> Mock:
+    """Autospec of a MealieClient instance, built once per session.
+
+    create_autospec walks every MealieClient method to copy its signature,
+    which is far more expensive than resetting the resulting mock.
+    """
+    return create_autospec(MealieClient, instance=True)
+
+
+@pytest.fixture
+def mock_client_isolated(_mealie_client_autospec: Mock) -> Mock:
+    """
+    Fully mocked MealieClient for tool tests that never touch HTTP.
+
+    Method calls are checked against the real MealieClient signatures.
+    The underlying autospec is shared across the session and reset here,
+    so configured return values and call history never leak between tests.
+
+    Returns:
+        Autospecced MealieClient mock with base_url and api_token set
+
+    Example:
+        def test_tool(mock_client_isolated):
+            mock_client_isolated.get.return_value = {"name": "Test"}
+            assert mock_client_isolated.get("/api/recipes/test")["name"] == "Test"
+    """
+    _mealie_client_autospec.reset_mock(return_value=True, side_effect=True)
+    _mealie_client_autospec.base_url = "https://test.example.com"
+    _mealie_client_autospec.api_token = "test-token"
+    return _mealie_client_autospec
 
 
 @pytest.fixture
@@ -248,3 +435,28 @@ def mock_server_error_response(mock_httpx_response: Mock) -> Mock:
         response=mock_httpx_response
     )
     return mock_httpx_response
+
+
+@pytest.fixture(scope="session")
+def http_404_response() -> httpx.Response:
+    """
+    Canonical 404 Not Found response for transport-level (respx) mocks.
+
+    Built once per session; respx clones a route's return_value for every
+    request, so the shared instance is never consumed or mutated.
+
+    Returns:
+        httpx.Response with a Mealie-style JSON error body
+    """
+    return httpx.Response(404, json={"detail": "Recipe not found"})
+
+
+@pytest.fixture(scope="session")
+def http_500_response() -> httpx.Response:
+    """
+    Canonical 500 Internal Server Error response for respx mocks.
+
+    Returns:
+        httpx.Response with a Mealie-style JSON error body
+    """
+    return httpx.Response(500, json={"detail": "Internal server error"})
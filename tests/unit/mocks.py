@@ -0,0 +1,139 @@
+"""Mock configuration helpers for unit tests.
+
+Provides a one-call way to wire return values and side effects onto a mocked
+MealieClient, so each test states its client responses in a single line, and
+a plain stub client for tools whose tests do not need Mock's introspection.
+
+Usage:
+    >>> from tests.unit.mocks import configure
+    >>> configure(mock_client, get=[build_mealplan()])
+    >>> configure(mock_client, raise_delete=ERR_404)
+    >>> mock_client = patch_client(monkeypatch, mealplans_module)
+    >>> stub = StubParserClient(parse_ingredient=build_parsed_ingredient())
+"""
+
+from contextlib import nullcontext
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from unittest.mock import Mock
+
+import pytest
+
+from src.client import MealieAPIError, MealieClient
+
+_RAISE_PREFIX = "raise_"
+
+# spec_set for patch_client's mock. Passing the attribute names rather than
+# the class spares Mock a dir(MealieClient) walk on every construction, and
+# typos such as ``mock_client.gte`` still raise AttributeError.
+_CLIENT_ATTRS = dir(MealieClient)
+
+# Client errors shared by the tool API-error tests. side_effect re-raises the
+# same instance, so configure() clears its traceback to keep it from growing.
+ERR_400 = MealieAPIError("Bad request", status_code=400, response_body="Invalid entry")
+ERR_401 = MealieAPIError("Authentication failed", status_code=401, response_body="Unauthorized")
+ERR_403 = MealieAPIError("Forbidden", status_code=403, response_body="Expired")
+ERR_404 = MealieAPIError("Not found", status_code=404, response_body="Not found")
+ERR_409 = MealieAPIError("Duplicate", status_code=409, response_body="Already exists")
+ERR_500 = MealieAPIError("Failed to fetch", status_code=500, response_body="Server error")
+
+
+def patch_client(
+    monkeypatch: pytest.MonkeyPatch, module: ModuleType, extra_attrs: Sequence[str] = ()
+) -> Mock:
+    """Patch a tool module's MealieClient to serve one spec'd mock.
+
+    ``with MealieClient() as client`` in the module's tools yields the
+    returned mock. MealieClient becomes a plain nullcontext factory rather
+    than a MagicMock, which would build every magic method just to serve
+    __enter__.
+
+    Args:
+        monkeypatch: The requesting test's monkeypatch fixture
+        module: Tool module whose MealieClient is replaced
+        extra_attrs: Client methods the module calls that MealieClient does
+            not define yet
+
+    Returns:
+        Mock restricted to MealieClient's attributes plus ``extra_attrs``
+
+    Example:
+        >>> @pytest.fixture(autouse=True)
+        ... def mock_client(monkeypatch):
+        ...     return patch_client(monkeypatch, mealplans_module)
+    """
+    client = Mock(spec_set=[*_CLIENT_ATTRS, *extra_attrs])
+    monkeypatch.setattr(module, "MealieClient", lambda: nullcontext(client))
+    return client
+
+
+def configure(client: Mock, **responses: Any) -> Mock:
+    """Set return values and side effects on a mock client's methods.
+
+    Args:
+        client: Mock (typically spec'd against MealieClient) to configure
+        **responses: Method name mapped to its return value. A ``raise_``
+            prefix sets the method's side_effect instead; an exception
+            instance has its traceback cleared first so it can be reused.
+
+    Returns:
+        The same mock, for chaining
+
+    Example:
+        >>> configure(mock_client, list_tags=[build_tag()], raise_create_tag=error)
+    """
+    for name, value in responses.items():
+        if name.startswith(_RAISE_PREFIX):
+            if isinstance(value, BaseException):
+                value = value.with_traceback(None)
+            getattr(client, name[len(_RAISE_PREFIX):]).side_effect = value
+        else:
+            getattr(client, name).return_value = value
+    return client
+
+
+class StubParserClient:
+    """Stand-in for MealieClient covering the ingredient parser endpoints.
+
+    A plain context manager with fixed responses; calls are recorded in
+    ``calls`` as ``(method, kwargs)`` tuples for assertions.
+
+    Args:
+        raises: Exception raised by every parser call instead of returning
+        **results: Method name mapped to the value it returns
+
+    Example:
+        >>> stub = StubParserClient(parse_ingredient=build_parsed_ingredient())
+        >>> stub.raises = MealieAPIError("Parser error", status_code=400)
+    """
+
+    def __init__(self, raises: Optional[Exception] = None, **results: Any) -> None:
+        self.results: Dict[str, Any] = results
+        self.raises = raises
+        self.calls: List[Tuple[str, Dict[str, Any]]] = []
+
+    def reset(self) -> None:
+        """Clear results, the pending exception and recorded calls for reuse."""
+        self.results.clear()
+        self.raises = None
+        self.calls.clear()
+
+    def __enter__(self) -> "StubParserClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> bool:
+        return False
+
+    def _respond(self, method: str, kwargs: Dict[str, Any]) -> Any:
+        self.calls.append((method, kwargs))
+        if self.raises is not None:
+            # Clear the traceback so a shared error instance doesn't grow one
+            raise self.raises.with_traceback(None)
+        return self.results[method]
+
+    def parse_ingredient(self, **kwargs: Any) -> Any:
+        return self._respond("parse_ingredient", kwargs)
+
+    def parse_ingredients_batch(self, **kwargs: Any) -> Any:
+        return self._respond("parse_ingredients_batch", kwargs)
+
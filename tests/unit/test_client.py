@@ -13,7 +13,9 @@ Coverage areas:
 - Specific API method wrappers
 """
 
+import json
 import os
+import httpx
 import pytest
 import respx
 from httpx import Response, ConnectError, TimeoutException
@@ -27,9 +29,99 @@ from tests.unit.builders import (
 )
 
 
-# =============================================================================
-# 1. Initialization Tests (5 tests)
-# =============================================================================
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+# Canonical builder output shared by tests that only read it; respx
+# serializes response bodies up front, so no test can mutate these.
+_RECIPE = build_recipe()
+_PARSED_INGREDIENT = build_parsed_ingredient()
+_TAG_VEGAN = build_tag(name="Vegan")
+_CATEGORY_DESSERT = build_category(name="Dessert")
+
+# Pre-encoded bodies for the mocks that return the canonical objects as-is
+_RECIPE_JSON = _dumps(_RECIPE)
+_PARSED_INGREDIENT_JSON = _dumps(_PARSED_INGREDIENT)
+_PARSED_INGREDIENT_LIST_JSON = _dumps([_PARSED_INGREDIENT])
+
+# respx clones a route's return_value per request, so one instance can back
+# every 204 No Content mock in this module.
+_RESP_204 = Response(204)
+
+
+@pytest.fixture(scope="module")
+def client(use_shared_transport):
+    """MealieClient shared by the respx-mocked tests in this module.
+
+    Its httpx client runs on the shared HTTP/1.1 transport from conftest.
+    Initialization tests construct MealieClient directly.
+    """
+    mealie = use_shared_transport(MealieClient("http://test.example.com", "token"))
+    yield mealie
+    mealie.close()
+
+
+# Named routes for the endpoints the bulk-operation tests hit. They are
+# compiled once onto a module-level router; each test enters the router,
+# which snapshots these routes, and the rollback on exit discards whatever
+# responses that test configured. Under pytest-xdist every worker imports
+# this module and so builds its own router.
+_ROUTES = {
+    "list_categories": ("GET", "/api/organizers/categories"),
+    "create_category": ("POST", "/api/organizers/categories"),
+    "list_tags": ("GET", "/api/organizers/tags"),
+    "create_tag": ("POST", "/api/organizers/tags"),
+    "bulk_tag": ("POST", "/api/recipes/bulk-actions/tag"),
+    "bulk_categorize": ("POST", "/api/recipes/bulk-actions/categorize"),
+}
+
+_ROUTER = respx.mock(base_url="http://test.example.com", assert_all_called=False)
+for _name, (_method, _path) in _ROUTES.items():
+    _ROUTER.request(_method, _path, name=_name)
+
+
+@pytest.fixture
+def respx_mock():
+    """Module router with the named routes from _ROUTES pre-registered."""
+    with _ROUTER:
+        yield _ROUTER
+
+
+# Route names used by bulk_tag_recipes / bulk_categorize_recipes per organizer
+_BULK_ROUTES = {
+    "tags": ("list_tags", "create_tag", "bulk_tag"),
+    "categories": ("list_categories", "create_category", "bulk_categorize"),
+}
+
+
+def _mock_bulk_action(router, organizer, recipes, existing, created=None, result=None):
+    """Configure every route a bulk tag/categorize call goes through.
+
+    Args:
+        router: respx_mock router with the _ROUTES pre-registered
+        organizer: "tags" or "categories"
+        recipes: Recipes fetched by slug before the bulk action
+        existing: Organizer list response (plain list or paginated dict)
+        created: Organizer returned when a missing one is created
+        result: Bulk-action response body
+    """
+    list_route, create_route, bulk_route = _BULK_ROUTES[organizer]
+    for recipe in recipes:
+        router.get(f"/api/recipes/{recipe['slug']}").respond(200, json=recipe)
+    router[list_route].respond(200, json=existing)
+    if created is not None:
+        router[create_route].respond(201, json=created)
+    router[bulk_route].respond(200, json=result)
+
+
+# --- 1. Initialization Tests ---
 
 class TestMealieClientInitialization:
     """Test MealieClient initialization and configuration."""
@@ -37,10 +129,10 @@ class TestMealieClientInitialization:
     def test_init_with_explicit_params(self):
         """Test client initialization with explicit URL and token."""
         client = MealieClient(
-            base_url="https://test.example.com",
+            base_url="http://test.example.com",
             api_token="test-token-123"
         )
-        assert client.base_url == "https://test.example.com"
+        assert client.base_url == "http://test.example.com"
         assert client.api_token == "test-token-123"
 
     def test_init_from_environment_vars(self):
@@ -63,12 +155,12 @@ class TestMealieClientInitialization:
         """Test initialization fails when token is missing."""
         with patch.dict(os.environ, {}, clear=True):
             with pytest.raises(ValueError, match="MEALIE_API_TOKEN must be set"):
-                MealieClient(base_url="https://test.example.com")
+                MealieClient(base_url="http://test.example.com")
 
     def test_init_sets_auth_headers(self):
         """Test authorization headers are set correctly."""
         client = MealieClient(
-            base_url="https://test.example.com",
+            base_url="http://test.example.com",
             api_token="secret-token"
         )
         assert "Authorization" in client.headers
@@ -79,194 +171,163 @@ class TestMealieClientInitialization:
     def test_init_strips_trailing_slash(self):
         """Test base URL trailing slash is stripped."""
         client = MealieClient(
-            base_url="https://test.example.com/",
+            base_url="http://test.example.com/",
             api_token="token"
         )
-        assert client.base_url == "https://test.example.com"
+        assert client.base_url == "http://test.example.com"
 
     def test_context_manager_support(self):
         """Test client works as context manager."""
         with MealieClient(
-            base_url="https://test.example.com",
+            base_url="http://test.example.com",
             api_token="token"
         ) as client:
             assert client is not None
-            assert client.base_url == "https://test.example.com"
+            assert client.base_url == "http://test.example.com"
 
 
-# =============================================================================
-# 2. HTTP Methods Tests (12 tests)
-# =============================================================================
+# --- 2. HTTP Methods Tests ---
 
 class TestMealieClientHTTPMethods:
     """Test basic HTTP method wrappers."""
 
-    @respx.mock
-    def test_get_method_success(self):
+    def test_get_method_success(self, client, respx_mock):
         """Test GET method returns JSON response."""
-        respx.get("https://test.example.com/api/recipes").mock(
+        respx_mock.get("/api/recipes").mock(
             return_value=Response(200, json={"items": [], "total": 0})
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.get("/api/recipes")
 
         assert result == {"items": [], "total": 0}
 
-    @respx.mock
-    def test_get_method_with_params(self):
+    def test_get_method_with_params(self, client, respx_mock):
         """Test GET method includes query parameters."""
-        route = respx.get(
-            "https://test.example.com/api/recipes",
+        route = respx_mock.get(
+            "/api/recipes",
             params={"page": "1", "perPage": "10"}
         ).mock(return_value=Response(200, json={"items": []}))
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.get("/api/recipes", params={"page": 1, "perPage": 10})
 
         assert result == {"items": []}
         assert route.called
 
-    @respx.mock
-    def test_post_method_success(self):
+    def test_post_method_success(self, client, respx_mock):
         """Test POST method sends JSON payload."""
-        recipe = build_recipe()
-        respx.post("https://test.example.com/api/recipes").mock(
-            return_value=Response(201, json=recipe)
+        respx_mock.post("/api/recipes").mock(
+            return_value=Response(201, content=_RECIPE_JSON, headers=_JSON_HEADERS)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.post("/api/recipes", json={"name": "Test Recipe"})
 
         assert result["slug"] == "test-recipe"
 
-    @respx.mock
-    def test_post_method_includes_auth(self):
+    def test_post_method_includes_auth(self, respx_mock):
         """Test POST includes authorization header."""
-        route = respx.post("https://test.example.com/api/recipes").mock(
+        route = respx_mock.post("/api/recipes").mock(
             return_value=Response(201, json={})
         )
 
-        client = MealieClient("https://test.example.com", "secret-token")
+        client = MealieClient("http://test.example.com", "secret-token")
         client.post("/api/recipes", json={"name": "Test"})
 
         assert route.calls.last.request.headers["Authorization"] == "Bearer secret-token"
 
-    @respx.mock
-    def test_put_method_success(self):
+    def test_put_method_success(self, client, respx_mock):
         """Test PUT method updates resource."""
         recipe = build_recipe(name="Updated Recipe")
-        respx.put("https://test.example.com/api/recipes/test").mock(
+        respx_mock.put("/api/recipes/test").mock(
             return_value=Response(200, json=recipe)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.put("/api/recipes/test", json={"name": "Updated Recipe"})
 
         assert result["name"] == "Updated Recipe"
 
-    @respx.mock
-    def test_patch_method_success(self):
+    def test_patch_method_success(self, client, respx_mock):
         """Test PATCH method partially updates resource."""
         recipe = build_recipe(description="New description")
-        respx.patch("https://test.example.com/api/recipes/test").mock(
+        respx_mock.patch("/api/recipes/test").mock(
             return_value=Response(200, json=recipe)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.patch("/api/recipes/test", json={"description": "New description"})
 
         assert result["description"] == "New description"
 
-    @respx.mock
-    def test_delete_method_success(self):
+    def test_delete_method_success(self, client, respx_mock):
         """Test DELETE method removes resource."""
-        respx.delete("https://test.example.com/api/recipes/test").mock(
-            return_value=Response(204)
+        respx_mock.delete("/api/recipes/test").mock(
+            return_value=_RESP_204
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.delete("/api/recipes/test")
 
         # DELETE with 204 returns None (no content)
         assert result is None
 
-    @respx.mock
-    def test_delete_method_with_json_response(self):
+    def test_delete_method_with_json_response(self, client, respx_mock):
         """Test DELETE can return JSON response."""
-        respx.delete("https://test.example.com/api/recipes/test").mock(
+        respx_mock.delete("/api/recipes/test").mock(
             return_value=Response(200, json={"success": True})
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.delete("/api/recipes/test")
 
         assert result == {"success": True}
 
-    @respx.mock
-    def test_get_empty_response_returns_none(self):
+    def test_get_empty_response_returns_none(self, client, respx_mock):
         """Test GET with empty response body returns None."""
-        respx.get("https://test.example.com/api/test").mock(
+        respx_mock.get("/api/test").mock(
             return_value=Response(200, content=b"")
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.get("/api/test")
 
         assert result is None
 
-    @respx.mock
-    def test_post_with_form_data(self):
+    def test_post_with_form_data(self, client, respx_mock):
         """Test POST can send form data instead of JSON."""
-        respx.post("https://test.example.com/api/upload").mock(
+        respx_mock.post("/api/upload").mock(
             return_value=Response(200, json={"success": True})
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.post("/api/upload", data={"key": "value"})
 
         assert result == {"success": True}
 
 
-# =============================================================================
-# 3. Error Handling Tests (8 tests)
-# =============================================================================
+# --- 3. Error Handling Tests ---
 
 class TestMealieClientErrorHandling:
     """Test error handling and error message parsing."""
 
-    @respx.mock
-    def test_get_404_raises_exception(self):
+    def test_get_404_raises_exception(self, client, respx_mock):
         """Test GET raises MealieAPIError on 404."""
-        respx.get("https://test.example.com/api/recipes/missing").mock(
+        respx_mock.get("/api/recipes/missing").mock(
             return_value=Response(404, json={"detail": "Not found"})
         )
 
-        client = MealieClient("https://test.example.com", "token")
-
         with pytest.raises(MealieAPIError) as exc_info:
             client.get("/api/recipes/missing")
 
         assert exc_info.value.status_code == 404
 
-    @respx.mock
-    def test_get_500_raises_exception(self):
+    def test_get_500_raises_exception(self, client, respx_mock):
         """Test GET raises MealieAPIError on 500."""
-        respx.get("https://test.example.com/api/recipes").mock(
+        respx_mock.get("/api/recipes").mock(
             return_value=Response(500, json={"error": "Internal server error"})
         )
 
-        client = MealieClient("https://test.example.com", "token")
-
         with pytest.raises(MealieAPIError) as exc_info:
             client.get("/api/recipes")
 
         assert exc_info.value.status_code == 500
 
-    @respx.mock
-    def test_post_422_validation_error(self):
+    def test_post_422_validation_error(self, client, respx_mock):
         """Test POST handles 422 validation error."""
-        respx.post("https://test.example.com/api/recipes").mock(
+        respx_mock.post("/api/recipes").mock(
             return_value=Response(422, json={
                 "detail": [
                     {"loc": ["body", "name"], "msg": "field required", "type": "value_error.missing"}
@@ -274,8 +335,6 @@ class TestMealieClientErrorHandling:
             })
         )
 
-        client = MealieClient("https://test.example.com", "token")
-
         with pytest.raises(MealieAPIError) as exc_info:
             client.post("/api/recipes", json={})
 
@@ -283,39 +342,30 @@ class TestMealieClientErrorHandling:
         assert error.status_code == 422
         assert "Validation Error" in str(error)
 
-    @respx.mock
-    def test_json_parse_error(self):
+    def test_json_parse_error(self, client, respx_mock):
         """Test handles malformed JSON response."""
-        respx.get("https://test.example.com/api/test").mock(
+        respx_mock.get("/api/test").mock(
             return_value=Response(200, content=b"not valid json {{{")
         )
 
-        client = MealieClient("https://test.example.com", "token")
-
         with pytest.raises(MealieAPIError, match="Unexpected error"):
             client.get("/api/test")
 
-    @respx.mock
-    def test_connection_error(self):
+    def test_connection_error(self, client, respx_mock):
         """Test handles connection errors."""
-        respx.get("https://test.example.com/api/test").mock(
+        respx_mock.get("/api/test").mock(
             side_effect=ConnectError("Connection refused")
         )
 
-        client = MealieClient("https://test.example.com", "token")
-
         with pytest.raises(MealieAPIError, match="Connection error"):
             client.get("/api/test")
 
-    @respx.mock
-    def test_timeout_error(self):
+    def test_timeout_error(self, client, respx_mock):
         """Test handles timeout errors."""
-        respx.get("https://test.example.com/api/test").mock(
+        respx_mock.get("/api/test").mock(
             side_effect=TimeoutException("Request timed out")
         )
 
-        client = MealieClient("https://test.example.com", "token")
-
         with pytest.raises(MealieAPIError):
             client.get("/api/test")
 
@@ -342,218 +392,182 @@ class TestMealieClientErrorHandling:
         assert "Field 'body -> name'" in result["details"][0]
 
 
-# =============================================================================
-# 4. URL Construction Tests (5 tests)
-# =============================================================================
+# --- 4. URL Construction Tests ---
 
 class TestMealieClientURLConstruction:
     """Test URL building and path handling."""
 
-    def test_build_url_with_leading_slash(self):
+    def test_build_url_with_leading_slash(self, client):
         """Test URL construction with leading slash."""
-        client = MealieClient("https://test.example.com", "token")
         url = client._build_url("/api/recipes")
 
-        assert url == "https://test.example.com/api/recipes"
+        assert url == "http://test.example.com/api/recipes"
 
-    def test_build_url_without_leading_slash(self):
+    def test_build_url_without_leading_slash(self, client):
         """Test URL construction adds leading slash."""
-        client = MealieClient("https://test.example.com", "token")
         url = client._build_url("api/recipes")
 
-        assert url == "https://test.example.com/api/recipes"
+        assert url == "http://test.example.com/api/recipes"
 
-    def test_build_url_with_path_segments(self):
+    def test_build_url_with_path_segments(self, client):
         """Test URL construction with multiple path segments."""
-        client = MealieClient("https://test.example.com", "token")
         url = client._build_url("/api/recipes/test-recipe/comments")
 
-        assert url == "https://test.example.com/api/recipes/test-recipe/comments"
+        assert url == "http://test.example.com/api/recipes/test-recipe/comments"
 
-    @respx.mock
-    def test_get_with_special_characters_in_path(self):
+    def test_get_with_special_characters_in_path(self, client, respx_mock):
         """Test GET handles special characters in path."""
-        respx.get("https://test.example.com/api/recipes/test-recipe-123").mock(
-            return_value=Response(200, json=build_recipe())
+        respx_mock.get("/api/recipes/test-recipe-123").mock(
+            return_value=Response(200, content=_RECIPE_JSON, headers=_JSON_HEADERS)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.get("/api/recipes/test-recipe-123")
 
         assert result is not None
 
-    @respx.mock
-    def test_get_with_query_params_encoding(self):
+    def test_get_with_query_params_encoding(self, client, respx_mock):
         """Test query parameters are properly encoded."""
-        route = respx.get(
-            "https://test.example.com/api/recipes",
+        route = respx_mock.get(
+            "/api/recipes",
             params={"search": "chicken soup"}
         ).mock(return_value=Response(200, json={"items": []}))
 
-        client = MealieClient("https://test.example.com", "token")
         client.get("/api/recipes", params={"search": "chicken soup"})
 
         assert route.called
 
 
-# =============================================================================
-# 5. Response Parsing Tests (5 tests)
-# =============================================================================
+# --- 5. Response Parsing Tests ---
 
 class TestMealieClientResponseParsing:
     """Test JSON response parsing and data handling."""
 
-    @respx.mock
-    def test_parse_simple_json_response(self):
+    def test_parse_simple_json_response(self, client, respx_mock):
         """Test parsing simple JSON object."""
-        respx.get("https://test.example.com/api/test").mock(
+        respx_mock.get("/api/test").mock(
             return_value=Response(200, json={"key": "value"})
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.get("/api/test")
 
         assert result == {"key": "value"}
 
-    @respx.mock
-    def test_parse_nested_json_response(self):
+    def test_parse_nested_json_response(self, client, respx_mock):
         """Test parsing nested JSON structures."""
         recipe = build_recipe(
             recipeIngredient=["2 cups flour", "1 tsp salt"],
-            tags=[build_tag(name="Vegan")]
+            tags=[_TAG_VEGAN]
         )
-        respx.get("https://test.example.com/api/recipes/test").mock(
+        respx_mock.get("/api/recipes/test").mock(
             return_value=Response(200, json=recipe)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.get("/api/recipes/test")
 
         assert isinstance(result["recipeIngredient"], list)
         assert isinstance(result["tags"], list)
         assert result["tags"][0]["name"] == "Vegan"
 
-    @respx.mock
-    def test_parse_paginated_response(self):
+    def test_parse_paginated_response(self, client, respx_mock):
         """Test parsing paginated response metadata."""
         paginated = {
-            "items": [build_recipe()],
+            "items": [_RECIPE],
             "total": 1,
             "page": 1,
             "perPage": 10,
             "totalPages": 1
         }
-        respx.get("https://test.example.com/api/recipes").mock(
+        respx_mock.get("/api/recipes").mock(
             return_value=Response(200, json=paginated)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.get("/api/recipes")
 
         assert "items" in result
         assert result["total"] == 1
         assert result["page"] == 1
 
-    @respx.mock
-    def test_parse_array_response(self):
+    def test_parse_array_response(self, client, respx_mock):
         """Test parsing JSON array response."""
-        tags = [build_tag(name="Vegan"), build_tag(name="Quick")]
-        respx.get("https://test.example.com/api/organizers/tags").mock(
+        tags = [_TAG_VEGAN, build_tag(name="Quick")]
+        respx_mock.get("/api/organizers/tags").mock(
             return_value=Response(200, json=tags)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.get("/api/organizers/tags")
 
         assert isinstance(result, list)
         assert len(result) == 2
 
-    @respx.mock
-    def test_parse_empty_json_object(self):
+    def test_parse_empty_json_object(self, client, respx_mock):
         """Test parsing empty JSON object."""
-        respx.get("https://test.example.com/api/test").mock(
+        respx_mock.get("/api/test").mock(
             return_value=Response(200, json={})
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.get("/api/test")
 
         assert result == {}
 
 
-# =============================================================================
-# 6. Retry Logic Tests (5 tests)
-# =============================================================================
+# --- 6. Retry Logic Tests ---
 
 class TestMealieClientRetryLogic:
     """Test retry behavior for transient failures."""
 
-    @respx.mock
-    def test_retry_on_500_server_error(self):
+    def test_retry_on_500_server_error(self, client, respx_mock):
         """Test retries 500 errors up to max attempts."""
-        route = respx.get("https://test.example.com/api/test").mock(
+        route = respx_mock.get("/api/test").mock(
             return_value=Response(500, json={"error": "Server error"})
         )
 
-        client = MealieClient("https://test.example.com", "token")
-
         with pytest.raises(MealieAPIError):
             client.get("/api/test")
 
         # Should retry MAX_RETRIES + 1 = 4 times
         assert route.call_count == 4
 
-    @respx.mock
-    def test_retry_on_connection_error(self):
+    def test_retry_on_connection_error(self, client, respx_mock):
         """Test retries connection errors."""
-        route = respx.get("https://test.example.com/api/test").mock(
+        route = respx_mock.get("/api/test").mock(
             side_effect=ConnectError("Connection failed")
         )
 
-        client = MealieClient("https://test.example.com", "token")
-
         with pytest.raises(MealieAPIError):
             client.get("/api/test")
 
         # Should retry MAX_RETRIES + 1 = 4 times
         assert route.call_count == 4
 
-    @respx.mock
-    def test_no_retry_on_404_client_error(self):
+    def test_no_retry_on_404_client_error(self, client, respx_mock):
         """Test does NOT retry 4xx client errors."""
-        route = respx.get("https://test.example.com/api/test").mock(
+        route = respx_mock.get("/api/test").mock(
             return_value=Response(404, json={"detail": "Not found"})
         )
 
-        client = MealieClient("https://test.example.com", "token")
-
         with pytest.raises(MealieAPIError):
             client.get("/api/test")
 
         # Should only try once (no retries for 4xx)
         assert route.call_count == 1
 
-    @respx.mock
-    def test_retry_succeeds_on_second_attempt(self):
+    def test_retry_succeeds_on_second_attempt(self, client, respx_mock):
         """Test successful retry after transient failure."""
         responses = [
             Response(500, json={"error": "Temporary failure"}),
             Response(200, json={"success": True})
         ]
-        route = respx.get("https://test.example.com/api/test").mock(
+        route = respx_mock.get("/api/test").mock(
             side_effect=responses
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.get("/api/test")
 
         assert result == {"success": True}
         assert route.call_count == 2
 
-    def test_should_retry_logic(self):
+    def test_should_retry_logic(self, client):
         """Test _should_retry determines retry eligibility."""
-        client = MealieClient("https://test.example.com", "token")
-
         # Should retry connection errors
         assert client._should_retry(ConnectError("test"), 0) is True
 
@@ -564,78 +578,64 @@ class TestMealieClientRetryLogic:
         assert client._should_retry(ValueError("test"), 0) is False
 
 
-# =============================================================================
-# 7. Recipe Methods Tests (8 tests)
-# =============================================================================
+# --- 7. Recipe Methods Tests ---
 
 class TestMealieClientRecipeMethods:
     """Test recipe-specific client methods."""
 
-    @respx.mock
-    def test_parse_ingredient(self):
+    def test_parse_ingredient(self, client, respx_mock):
         """Test parse_ingredient sends correct payload."""
-        parsed = build_parsed_ingredient()
-        route = respx.post("https://test.example.com/api/parser/ingredient").mock(
-            return_value=Response(200, json=parsed)
+        route = respx_mock.post("/api/parser/ingredient").mock(
+            return_value=Response(200, content=_PARSED_INGREDIENT_JSON, headers=_JSON_HEADERS)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.parse_ingredient("2 cups flour")
 
         assert result["ingredient"]["quantity"] == 2.0
         assert route.called
 
-    @respx.mock
-    def test_parse_ingredients_batch(self):
+    def test_parse_ingredients_batch(self, client, respx_mock):
         """Test parse_ingredients_batch handles multiple ingredients."""
         parsed_list = [
             build_parsed_ingredient("2 cups flour", 2.0, "cup", "flour"),
             build_parsed_ingredient("1 tsp salt", 1.0, "teaspoon", "salt")
         ]
-        respx.post("https://test.example.com/api/parser/ingredients").mock(
+        respx_mock.post("/api/parser/ingredients").mock(
             return_value=Response(200, json=parsed_list)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.parse_ingredients_batch(["2 cups flour", "1 tsp salt"])
 
         assert len(result) == 2
         assert result[0]["ingredient"]["food"]["name"] == "flour"
 
-    @respx.mock
-    def test_duplicate_recipe(self):
+    def test_duplicate_recipe(self, client, respx_mock):
         """Test duplicate_recipe creates copy."""
         new_recipe = build_recipe(name="Copy of Test Recipe", slug="copy-of-test-recipe")
-        respx.post("https://test.example.com/api/recipes/test-recipe/duplicate").mock(
+        respx_mock.post("/api/recipes/test-recipe/duplicate").mock(
             return_value=Response(200, json=new_recipe)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.duplicate_recipe("test-recipe", new_name="Copy of Test Recipe")
 
         assert result["name"] == "Copy of Test Recipe"
 
-    @respx.mock
-    def test_update_recipe_last_made(self):
+    def test_update_recipe_last_made(self, client, respx_mock):
         """Test update_recipe_last_made sets timestamp."""
-        recipe = build_recipe()
-        respx.patch("https://test.example.com/api/recipes/test-recipe/last-made").mock(
-            return_value=Response(200, json=recipe)
+        respx_mock.patch("/api/recipes/test-recipe/last-made").mock(
+            return_value=Response(200, content=_RECIPE_JSON, headers=_JSON_HEADERS)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.update_recipe_last_made("test-recipe", "2025-12-23T10:00:00Z")
 
         assert result is not None
 
-    @respx.mock
-    def test_create_recipes_from_urls_bulk(self):
+    def test_create_recipes_from_urls_bulk(self, client, respx_mock):
         """Test bulk URL import."""
-        respx.post("https://test.example.com/api/recipes/create/url/bulk").mock(
+        respx_mock.post("/api/recipes/create/url/bulk").mock(
             return_value=Response(200, json={"imported": 2})
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.create_recipes_from_urls_bulk([
             "https://example.com/recipe1",
             "https://example.com/recipe2"
@@ -643,38 +643,32 @@ class TestMealieClientRecipeMethods:
 
         assert result["imported"] == 2
 
-    @respx.mock
-    def test_bulk_delete_recipes(self):
+    def test_bulk_delete_recipes(self, client, respx_mock):
         """Test bulk recipe deletion."""
-        respx.post("https://test.example.com/api/recipes/bulk-actions/delete").mock(
+        respx_mock.post("/api/recipes/bulk-actions/delete").mock(
             return_value=Response(200, json={"deleted": 3})
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.bulk_delete_recipes(["recipe-1", "recipe-2", "recipe-3"])
 
         assert result["deleted"] == 3
 
-    @respx.mock
-    def test_bulk_export_recipes(self):
+    def test_bulk_export_recipes(self, client, respx_mock):
         """Test bulk recipe export."""
-        respx.post("https://test.example.com/api/recipes/bulk-actions/export").mock(
+        respx_mock.post("/api/recipes/bulk-actions/export").mock(
             return_value=Response(200, json={"exported": 2})
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.bulk_export_recipes(["recipe-1", "recipe-2"], export_format="json")
 
         assert result["exported"] == 2
 
-    @respx.mock
-    def test_bulk_update_settings(self):
+    def test_bulk_update_settings(self, client, respx_mock):
         """Test bulk settings update."""
-        respx.post("https://test.example.com/api/recipes/bulk-actions/settings").mock(
+        respx_mock.post("/api/recipes/bulk-actions/settings").mock(
             return_value=Response(200, json={"updated": 2})
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.bulk_update_settings(
             ["recipe-1", "recipe-2"],
             {"public": True}
@@ -683,367 +677,305 @@ class TestMealieClientRecipeMethods:
         assert result["updated"] == 2
 
 
-# =============================================================================
-# 8. Meal Plan Methods Tests (3 tests)
-# =============================================================================
+# --- 8. Meal Plan Methods Tests ---
 
 class TestMealieClientMealPlanMethods:
     """Test meal plan-specific client methods."""
 
-    @respx.mock
-    def test_list_mealplan_rules(self):
+    def test_list_mealplan_rules(self, client, respx_mock):
         """Test list_mealplan_rules endpoint."""
         rules = [{"id": "rule-1", "name": "Dinner Rule", "entryType": "dinner"}]
-        respx.get("https://test.example.com/api/households/mealplans/rules").mock(
+        respx_mock.get("/api/households/mealplans/rules").mock(
             return_value=Response(200, json=rules)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.list_mealplan_rules()
 
         assert len(result) == 1
         assert result[0]["name"] == "Dinner Rule"
 
-    @respx.mock
-    def test_create_mealplan_rule(self):
+    def test_create_mealplan_rule(self, client, respx_mock):
         """Test create_mealplan_rule sends correct payload."""
         rule = {"id": "rule-1", "name": "Dinner Rule", "entryType": "dinner"}
-        route = respx.post("https://test.example.com/api/households/mealplans/rules").mock(
+        route = respx_mock.post("/api/households/mealplans/rules").mock(
             return_value=Response(201, json=rule)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.create_mealplan_rule("Dinner Rule", "dinner", tags=["Vegan"])
 
         assert result["name"] == "Dinner Rule"
         assert route.called
 
-    @respx.mock
-    def test_delete_mealplan_rule(self):
+    def test_delete_mealplan_rule(self, client, respx_mock):
         """Test delete_mealplan_rule endpoint."""
-        respx.delete("https://test.example.com/api/households/mealplans/rules/rule-1").mock(
-            return_value=Response(204)
+        respx_mock.delete("/api/households/mealplans/rules/rule-1").mock(
+            return_value=_RESP_204
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.delete_mealplan_rule("rule-1")
 
         assert result is None
 
 
-# =============================================================================
-# 9. Shopping Methods Tests (3 tests)
-# =============================================================================
+# --- 9. Shopping Methods Tests ---
 
 class TestMealieClientShoppingMethods:
     """Test shopping list-specific client methods."""
 
-    @respx.mock
-    def test_delete_recipe_from_shopping_list(self):
+    def test_delete_recipe_from_shopping_list(self, client, respx_mock):
         """Test removing recipe ingredients from shopping list."""
-        respx.post(
-            "https://test.example.com/api/households/shopping/lists/list-1/recipe/recipe-1/delete"
+        respx_mock.post(
+            "/api/households/shopping/lists/list-1/recipe/recipe-1/delete"
         ).mock(return_value=Response(200, json={"success": True}))
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.delete_recipe_from_shopping_list("list-1", "recipe-1")
 
         assert result["success"] is True
 
 
-# =============================================================================
-# 10. Foods & Units Methods Tests (6 tests)
-# =============================================================================
+# --- 10. Foods & Units Methods Tests ---
 
 class TestMealieClientFoodsAndUnits:
     """Test foods and units management methods."""
 
-    @respx.mock
-    def test_create_food(self):
+    def test_create_food(self, client, respx_mock):
         """Test create_food sends correct payload."""
         food = build_food(name="All Purpose Flour")
-        respx.post("https://test.example.com/api/foods").mock(
+        respx_mock.post("/api/foods").mock(
             return_value=Response(201, json=food)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.create_food("All Purpose Flour", description="Test flour")
 
         assert result["name"] == "All Purpose Flour"
 
-    @respx.mock
-    def test_list_foods_with_pagination(self):
+    def test_list_foods_with_pagination(self, client, respx_mock):
         """Test list_foods includes pagination params."""
-        route = respx.get(
-            "https://test.example.com/api/foods",
+        route = respx_mock.get(
+            "/api/foods",
             params={"page": "2", "perPage": "25"}
         ).mock(return_value=Response(200, json={"items": [], "total": 0}))
 
-        client = MealieClient("https://test.example.com", "token")
         client.list_foods(page=2, per_page=25)
 
         assert route.called
 
-    @respx.mock
-    def test_merge_foods(self):
+    def test_merge_foods(self, client, respx_mock):
         """Test merge_foods combines two foods."""
-        respx.post("https://test.example.com/api/foods/merge").mock(
+        respx_mock.post("/api/foods/merge").mock(
             return_value=Response(200, json={"success": True})
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.merge_foods("food-1", "food-2")
 
         assert result["success"] is True
 
-    @respx.mock
-    def test_create_unit(self):
+    def test_create_unit(self, client, respx_mock):
         """Test create_unit sends correct payload."""
         unit = build_unit(name="tablespoon", abbreviation="tbsp")
-        respx.post("https://test.example.com/api/units").mock(
+        respx_mock.post("/api/units").mock(
             return_value=Response(201, json=unit)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.create_unit("tablespoon", abbreviation="tbsp")
 
         assert result["name"] == "tablespoon"
 
-    @respx.mock
-    def test_update_unit(self):
+    def test_update_unit(self, client, respx_mock):
         """Test update_unit patches unit fields."""
         unit = build_unit(name="tablespoon", abbreviation="T")
-        respx.patch("https://test.example.com/api/units/unit-1").mock(
+        respx_mock.patch("/api/units/unit-1").mock(
             return_value=Response(200, json=unit)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.update_unit("unit-1", abbreviation="T")
 
         assert result is not None
 
-    @respx.mock
-    def test_merge_units(self):
+    def test_merge_units(self, client, respx_mock):
         """Test merge_units combines two units."""
-        respx.post("https://test.example.com/api/units/merge").mock(
+        respx_mock.post("/api/units/merge").mock(
             return_value=Response(200, json={"success": True})
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.merge_units("unit-1", "unit-2")
 
         assert result["success"] is True
 
 
-# =============================================================================
-# 11. Organizers Methods Tests (6 tests)
-# =============================================================================
+# --- 11. Organizers Methods Tests ---
 
 class TestMealieClientOrganizers:
     """Test organizers (categories, tags, tools) methods."""
 
-    @respx.mock
-    def test_list_categories(self):
+    def test_list_categories(self, client, respx_mock):
         """Test list_categories returns array."""
-        categories = [build_category(name="Dessert")]
-        respx.get("https://test.example.com/api/organizers/categories").mock(
+        categories = [_CATEGORY_DESSERT]
+        respx_mock.get("/api/organizers/categories").mock(
             return_value=Response(200, json=categories)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.list_categories()
 
         assert len(result) == 1
         assert result[0]["name"] == "Dessert"
 
-    @respx.mock
-    def test_create_tag(self):
+    def test_create_tag(self, client, respx_mock):
         """Test create_tag sends name payload."""
-        tag = build_tag(name="Vegan")
-        respx.post("https://test.example.com/api/organizers/tags").mock(
+        tag = _TAG_VEGAN
+        respx_mock.post("/api/organizers/tags").mock(
             return_value=Response(201, json=tag)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.create_tag("Vegan")
 
         assert result["name"] == "Vegan"
 
-    @respx.mock
-    def test_update_category(self):
+    def test_update_category(self, client, respx_mock):
         """Test update_category patches fields."""
         category = build_category(name="Main Dishes")
-        respx.patch("https://test.example.com/api/organizers/categories/cat-1").mock(
+        respx_mock.patch("/api/organizers/categories/cat-1").mock(
             return_value=Response(200, json=category)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.update_category("cat-1", name="Main Dishes")
 
         assert result["name"] == "Main Dishes"
 
-    @respx.mock
-    def test_delete_tag(self):
+    def test_delete_tag(self, client, respx_mock):
         """Test delete_tag removes tag."""
-        respx.delete("https://test.example.com/api/organizers/tags/tag-1").mock(
-            return_value=Response(204)
+        respx_mock.delete("/api/organizers/tags/tag-1").mock(
+            return_value=_RESP_204
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.delete_tag("tag-1")
 
         assert result is None
 
-    @respx.mock
-    def test_create_tool(self):
+    def test_create_tool(self, client, respx_mock):
         """Test create_tool creates kitchen tool."""
         tool = build_tool(name="Blender")
-        respx.post("https://test.example.com/api/organizers/tools").mock(
+        respx_mock.post("/api/organizers/tools").mock(
             return_value=Response(201, json=tool)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.create_tool("Blender")
 
         assert result["name"] == "Blender"
 
-    @respx.mock
-    def test_list_tools(self):
+    def test_list_tools(self, client, respx_mock):
         """Test list_tools returns array."""
         tools = [build_tool(name="Stand Mixer")]
-        respx.get("https://test.example.com/api/organizers/tools").mock(
+        respx_mock.get("/api/organizers/tools").mock(
             return_value=Response(200, json=tools)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.list_tools()
 
         assert len(result) == 1
 
 
-# =============================================================================
-# 12. Cookbooks Methods Tests (3 tests)
-# =============================================================================
+# --- 12. Cookbooks Methods Tests ---
 
 class TestMealieClientCookbooks:
     """Test cookbook management methods."""
 
-    @respx.mock
-    def test_list_cookbooks(self):
+    def test_list_cookbooks(self, client, respx_mock):
         """Test list_cookbooks endpoint."""
         cookbooks = [build_cookbook(name="Holiday Recipes")]
-        respx.get("https://test.example.com/api/households/cookbooks").mock(
+        respx_mock.get("/api/households/cookbooks").mock(
             return_value=Response(200, json=cookbooks)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.list_cookbooks()
 
         assert len(result) == 1
 
-    @respx.mock
-    def test_create_cookbook(self):
+    def test_create_cookbook(self, client, respx_mock):
         """Test create_cookbook sends correct payload."""
         cookbook = build_cookbook(name="New Cookbook", public=True)
-        respx.post("https://test.example.com/api/households/cookbooks").mock(
+        respx_mock.post("/api/households/cookbooks").mock(
             return_value=Response(201, json=cookbook)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.create_cookbook("New Cookbook", public=True)
 
         assert result["name"] == "New Cookbook"
         assert result["public"] is True
 
-    @respx.mock
-    def test_delete_cookbook(self):
+    def test_delete_cookbook(self, client, respx_mock):
         """Test delete_cookbook removes cookbook."""
-        respx.delete("https://test.example.com/api/households/cookbooks/cookbook-1").mock(
-            return_value=Response(204)
+        respx_mock.delete("/api/households/cookbooks/cookbook-1").mock(
+            return_value=_RESP_204
         )
 
-        client = MealieClient("https://test.example.com", "token")
         client.delete_cookbook("cookbook-1")
 
 
-# =============================================================================
-# 13. Comments Methods Tests (3 tests)
-# =============================================================================
+# --- 13. Comments Methods Tests ---
 
 class TestMealieClientComments:
     """Test recipe comments methods."""
 
-    @respx.mock
-    def test_get_recipe_comments(self):
+    def test_get_recipe_comments(self, client, respx_mock):
         """Test get_recipe_comments retrieves comments for recipe."""
         comments = [build_comment(text="Great recipe!")]
-        respx.get("https://test.example.com/api/recipes/test-recipe/comments").mock(
+        respx_mock.get("/api/recipes/test-recipe/comments").mock(
             return_value=Response(200, json=comments)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.get_recipe_comments("test-recipe")
 
         assert len(result) == 1
 
-    @respx.mock
-    def test_create_comment(self):
+    def test_create_comment(self, client, respx_mock):
         """Test create_comment posts new comment."""
         comment = build_comment(text="Delicious!")
-        respx.post("https://test.example.com/api/comments").mock(
+        respx_mock.post("/api/comments").mock(
             return_value=Response(201, json=comment)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.create_comment("recipe-123", "Delicious!")
 
         assert result["text"] == "Delicious!"
 
-    @respx.mock
-    def test_update_comment(self):
+    def test_update_comment(self, client, respx_mock):
         """Test update_comment modifies existing comment."""
         comment = build_comment(text="Updated comment")
-        respx.put("https://test.example.com/api/comments/comment-1").mock(
+        respx_mock.put("/api/comments/comment-1").mock(
             return_value=Response(200, json=comment)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.update_comment("comment-1", "Updated comment")
 
         assert result["text"] == "Updated comment"
 
 
-# =============================================================================
-# 14. Timeline Events Methods Tests (3 tests)
-# =============================================================================
+# --- 14. Timeline Events Methods Tests ---
 
 class TestMealieClientTimeline:
     """Test recipe timeline events methods."""
 
-    @respx.mock
-    def test_list_timeline_events(self):
+    def test_list_timeline_events(self, client, respx_mock):
         """Test list_timeline_events with pagination."""
         events = [build_timeline_event(subject="Made for dinner")]
-        route = respx.get(
-            "https://test.example.com/api/recipes/timeline/events",
+        route = respx_mock.get(
+            "/api/recipes/timeline/events",
             params={"page": "1", "perPage": "50"}
         ).mock(return_value=Response(200, json={"items": events, "total": 1}))
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.list_timeline_events(page=1, per_page=50)
 
         assert route.called
         assert len(result["items"]) == 1
 
-    @respx.mock
-    def test_create_timeline_event(self):
+    def test_create_timeline_event(self, client, respx_mock):
         """Test create_timeline_event creates new event."""
         event = build_timeline_event(subject="Made for party")
-        respx.post("https://test.example.com/api/recipes/timeline/events").mock(
+        respx_mock.post("/api/recipes/timeline/events").mock(
             return_value=Response(201, json=event)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.create_timeline_event(
             recipe_id="recipe-123",
             subject="Made for party",
@@ -1052,67 +984,53 @@ class TestMealieClientTimeline:
 
         assert result["subject"] == "Made for party"
 
-    @respx.mock
-    def test_delete_timeline_event(self):
+    def test_delete_timeline_event(self, client, respx_mock):
         """Test delete_timeline_event removes event."""
-        respx.delete("https://test.example.com/api/recipes/timeline/events/event-1").mock(
-            return_value=Response(204)
+        respx_mock.delete("/api/recipes/timeline/events/event-1").mock(
+            return_value=_RESP_204
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.delete_timeline_event("event-1")
 
         assert result is None
 
 
-# =============================================================================
-# 15. Connection Testing (2 tests)
-# =============================================================================
+# --- 15. Connection Testing ---
 
 class TestMealieClientConnectionTesting:
     """Test connection testing functionality."""
 
-    @respx.mock
-    def test_test_connection_success(self):
-        """Test test_connection returns True on success."""
-        respx.get("https://test.example.com/api/app/about").mock(
-            return_value=Response(200, json={"version": "1.0.0"})
+    @pytest.mark.parametrize("status,body,exc", [
+        (200, {"version": "1.0.0"}, None),
+        (200, {}, None),
+        (200, {"apiVersion": "2.0.0"}, None),
+        (200, {"versionAPI": "3.0.0"}, None),
+        (401, {"error": "Unauthorized"}, MealieAPIError),
+    ], ids=["success", "empty_response", "apiVersion_key", "versionAPI_key", "failure"])
+    def test_test_connection(self, client, respx_mock, status, body, exc):
+        """Test test_connection returns True on success and raises on failure."""
+        respx_mock.get("/api/app/about").mock(
+            return_value=Response(status, json=body)
         )
 
-        client = MealieClient("https://test.example.com", "token")
-        result = client.test_connection()
-
-        assert result is True
+        if exc:
+            with pytest.raises(exc):
+                client.test_connection()
+        else:
+            assert client.test_connection() is True
 
-    @respx.mock
-    def test_test_connection_failure(self):
-        """Test test_connection raises error on failure."""
-        respx.get("https://test.example.com/api/app/about").mock(
-            return_value=Response(401, json={"error": "Unauthorized"})
-        )
 
-        client = MealieClient("https://test.example.com", "token")
-
-        with pytest.raises(MealieAPIError):
-            client.test_connection()
-
-
-# =============================================================================
-# 16. Additional Client Methods (15 tests)
-# =============================================================================
+# --- 16. Additional Client Methods ---
 
 class TestMealieClientAdditionalMethods:
     """Test additional uncovered client methods."""
 
-    @respx.mock
-    def test_update_recipe_ingredients(self):
+    def test_update_recipe_ingredients(self, client, respx_mock):
         """Test update_recipe_ingredients patches ingredient list."""
-        recipe = build_recipe()
-        respx.patch("https://test.example.com/api/recipes/test-recipe").mock(
-            return_value=Response(200, json=recipe)
+        respx_mock.patch("/api/recipes/test-recipe").mock(
+            return_value=Response(200, content=_RECIPE_JSON, headers=_JSON_HEADERS)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         ingredients = [
             {"quantity": 2.0, "unit": "cup", "food": "flour", "display": "2 cups flour"}
         ]
@@ -1120,662 +1038,381 @@ class TestMealieClientAdditionalMethods:
 
         assert result is not None
 
-    @respx.mock
-    def test_update_food_fetches_current_first(self):
+    def test_update_food_fetches_current_first(self, client, respx_mock):
         """Test update_food fetches current food before updating."""
         current_food = build_food(name="Flour", description="Old description")
         updated_food = build_food(name="All Purpose Flour", description="New description")
 
-        respx.get("https://test.example.com/api/foods/food-1").mock(
+        respx_mock.get("/api/foods/food-1").mock(
             return_value=Response(200, json=current_food)
         )
-        respx.put("https://test.example.com/api/foods/food-1").mock(
+        respx_mock.put("/api/foods/food-1").mock(
             return_value=Response(200, json=updated_food)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.update_food("food-1", name="All Purpose Flour", description="New description")
 
         assert result["name"] == "All Purpose Flour"
 
-    @respx.mock
-    def test_get_mealplan_rule(self):
+    def test_get_mealplan_rule(self, client, respx_mock):
         """Test get_mealplan_rule retrieves specific rule."""
         rule = {"id": "rule-1", "name": "Dinner Rule", "entryType": "dinner"}
-        respx.get("https://test.example.com/api/households/mealplans/rules/rule-1").mock(
+        respx_mock.get("/api/households/mealplans/rules/rule-1").mock(
             return_value=Response(200, json=rule)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.get_mealplan_rule("rule-1")
 
         assert result["name"] == "Dinner Rule"
 
-    @respx.mock
-    def test_update_mealplan_rule(self):
+    def test_update_mealplan_rule(self, client, respx_mock):
         """Test update_mealplan_rule patches rule fields."""
         rule = {"id": "rule-1", "name": "Updated Rule", "entryType": "lunch"}
-        respx.patch("https://test.example.com/api/households/mealplans/rules/rule-1").mock(
+        respx_mock.patch("/api/households/mealplans/rules/rule-1").mock(
             return_value=Response(200, json=rule)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.update_mealplan_rule("rule-1", name="Updated Rule", entry_type="lunch")
 
         assert result["name"] == "Updated Rule"
 
-    @respx.mock
-    def test_get_food(self):
-        """Test get_food retrieves specific food."""
-        food = build_food(name="Flour")
-        respx.get("https://test.example.com/api/foods/food-1").mock(
-            return_value=Response(200, json=food)
-        )
-
-        client = MealieClient("https://test.example.com", "token")
-        result = client.get_food("food-1")
-
-        assert result["name"] == "Flour"
-
-    @respx.mock
-    def test_delete_food(self):
-        """Test delete_food removes food."""
-        respx.delete("https://test.example.com/api/foods/food-1").mock(
-            return_value=Response(204)
-        )
-
-        client = MealieClient("https://test.example.com", "token")
-        result = client.delete_food("food-1")
-
-        assert result is None
-
-    @respx.mock
-    def test_get_unit(self):
-        """Test get_unit retrieves specific unit."""
-        unit = build_unit(name="cup")
-        respx.get("https://test.example.com/api/units/unit-1").mock(
-            return_value=Response(200, json=unit)
-        )
-
-        client = MealieClient("https://test.example.com", "token")
-        result = client.get_unit("unit-1")
-
-        assert result["name"] == "cup"
-
-    @respx.mock
-    def test_delete_unit(self):
-        """Test delete_unit removes unit."""
-        respx.delete("https://test.example.com/api/units/unit-1").mock(
-            return_value=Response(204)
-        )
-
-        client = MealieClient("https://test.example.com", "token")
-        result = client.delete_unit("unit-1")
-
-        assert result is None
-
-    @respx.mock
-    def test_get_cookbook(self):
-        """Test get_cookbook retrieves specific cookbook."""
-        cookbook = build_cookbook(name="Test Cookbook")
-        respx.get("https://test.example.com/api/households/cookbooks/cookbook-1").mock(
-            return_value=Response(200, json=cookbook)
-        )
-
-        client = MealieClient("https://test.example.com", "token")
-        result = client.get_cookbook("cookbook-1")
-
-        assert result["name"] == "Test Cookbook"
-
-    @respx.mock
-    def test_update_cookbook(self):
+    def test_update_cookbook(self, client, respx_mock):
         """Test update_cookbook updates cookbook fields."""
         cookbook = build_cookbook(name="Updated Cookbook", public=True)
-        respx.put("https://test.example.com/api/households/cookbooks/cookbook-1").mock(
+        respx_mock.put("/api/households/cookbooks/cookbook-1").mock(
             return_value=Response(200, json=cookbook)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.update_cookbook("cookbook-1", name="Updated Cookbook", public=True)
 
         assert result["name"] == "Updated Cookbook"
         assert result["public"] is True
 
-    @respx.mock
-    def test_get_comment(self):
-        """Test get_comment retrieves specific comment."""
-        comment = build_comment(text="Great!")
-        respx.get("https://test.example.com/api/comments/comment-1").mock(
-            return_value=Response(200, json=comment)
-        )
-
-        client = MealieClient("https://test.example.com", "token")
-        result = client.get_comment("comment-1")
-
-        assert result["text"] == "Great!"
-
-    @respx.mock
-    def test_delete_comment(self):
-        """Test delete_comment removes comment."""
-        respx.delete("https://test.example.com/api/comments/comment-1").mock(
-            return_value=Response(204)
-        )
-
-        client = MealieClient("https://test.example.com", "token")
-        client.delete_comment("comment-1")
-
-    @respx.mock
-    def test_get_timeline_event(self):
-        """Test get_timeline_event retrieves specific event."""
-        event = build_timeline_event(subject="Made for party")
-        respx.get("https://test.example.com/api/recipes/timeline/events/event-1").mock(
-            return_value=Response(200, json=event)
-        )
-
-        client = MealieClient("https://test.example.com", "token")
-        result = client.get_timeline_event("event-1")
-
-        assert result["subject"] == "Made for party"
-
-    @respx.mock
-    def test_update_timeline_event(self):
+    def test_update_timeline_event(self, client, respx_mock):
         """Test update_timeline_event updates event fields."""
         event = build_timeline_event(subject="Updated subject")
-        respx.put("https://test.example.com/api/recipes/timeline/events/event-1").mock(
+        respx_mock.put("/api/recipes/timeline/events/event-1").mock(
             return_value=Response(200, json=event)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.update_timeline_event("event-1", subject="Updated subject")
 
         assert result["subject"] == "Updated subject"
 
-    @respx.mock
-    def test_get_category(self):
-        """Test get_category retrieves specific category."""
-        category = build_category(name="Dessert")
-        respx.get("https://test.example.com/api/organizers/categories/cat-1").mock(
-            return_value=Response(200, json=category)
-        )
-
-        client = MealieClient("https://test.example.com", "token")
-        result = client.get_category("cat-1")
-
-        assert result["name"] == "Dessert"
-
-    @respx.mock
-    def test_delete_category(self):
-        """Test delete_category removes category."""
-        respx.delete("https://test.example.com/api/organizers/categories/cat-1").mock(
-            return_value=Response(204)
-        )
-
-        client = MealieClient("https://test.example.com", "token")
-        result = client.delete_category("cat-1")
-
-        assert result is None
-
-    @respx.mock
-    def test_get_tag(self):
-        """Test get_tag retrieves specific tag."""
-        tag = build_tag(name="Vegan")
-        respx.get("https://test.example.com/api/organizers/tags/tag-1").mock(
-            return_value=Response(200, json=tag)
-        )
-
-        client = MealieClient("https://test.example.com", "token")
-        result = client.get_tag("tag-1")
-
-        assert result["name"] == "Vegan"
-
-    @respx.mock
-    def test_update_tag(self):
+    def test_update_tag(self, client, respx_mock):
         """Test update_tag patches tag fields."""
         tag = build_tag(name="Plant-Based")
-        respx.patch("https://test.example.com/api/organizers/tags/tag-1").mock(
+        respx_mock.patch("/api/organizers/tags/tag-1").mock(
             return_value=Response(200, json=tag)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.update_tag("tag-1", name="Plant-Based")
 
         assert result["name"] == "Plant-Based"
 
-    @respx.mock
-    def test_get_tool(self):
-        """Test get_tool retrieves specific kitchen tool."""
-        tool = build_tool(name="Blender")
-        respx.get("https://test.example.com/api/organizers/tools/tool-1").mock(
-            return_value=Response(200, json=tool)
-        )
-
-        client = MealieClient("https://test.example.com", "token")
-        result = client.get_tool("tool-1")
-
-        assert result["name"] == "Blender"
-
-    @respx.mock
-    def test_update_tool(self):
+    def test_update_tool(self, client, respx_mock):
         """Test update_tool patches tool fields."""
         tool = build_tool(name="Food Processor")
-        respx.patch("https://test.example.com/api/organizers/tools/tool-1").mock(
+        respx_mock.patch("/api/organizers/tools/tool-1").mock(
             return_value=Response(200, json=tool)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.update_tool("tool-1", name="Food Processor")
 
         assert result["name"] == "Food Processor"
 
-    @respx.mock
-    def test_delete_tool(self):
-        """Test delete_tool removes kitchen tool."""
-        respx.delete("https://test.example.com/api/organizers/tools/tool-1").mock(
-            return_value=Response(204)
-        )
-
-        client = MealieClient("https://test.example.com", "token")
-        result = client.delete_tool("tool-1")
+    @pytest.mark.parametrize("method_name,id_arg,path,body", [
+        ("get_food", "food-1", "/api/foods/food-1", build_food(name="Flour")),
+        ("get_unit", "unit-1", "/api/units/unit-1", build_unit(name="cup")),
+        ("get_cookbook", "cookbook-1", "/api/households/cookbooks/cookbook-1",
+         build_cookbook(name="Test Cookbook")),
+        ("get_comment", "comment-1", "/api/comments/comment-1", build_comment(text="Great!")),
+        ("get_timeline_event", "event-1", "/api/recipes/timeline/events/event-1",
+         build_timeline_event(subject="Made for party")),
+        ("get_category", "cat-1", "/api/organizers/categories/cat-1", _CATEGORY_DESSERT),
+        ("get_tag", "tag-1", "/api/organizers/tags/tag-1", _TAG_VEGAN),
+        ("get_tool", "tool-1", "/api/organizers/tools/tool-1", build_tool(name="Blender")),
+    ], ids=[
+        "get_food", "get_unit", "get_cookbook", "get_comment",
+        "get_timeline_event", "get_category", "get_tag", "get_tool",
+    ])
+    def test_get_by_id(self, client, respx_mock, method_name, id_arg, path, body):
+        """Test get_* wrappers fetch a single object by ID."""
+        respx_mock.get(path).mock(return_value=Response(200, json=body))
+
+        result = getattr(client, method_name)(id_arg)
+
+        assert result == body
+
+    @pytest.mark.parametrize("method_name,id_arg,path", [
+        ("delete_food", "food-1", "/api/foods/food-1"),
+        ("delete_unit", "unit-1", "/api/units/unit-1"),
+        ("delete_comment", "comment-1", "/api/comments/comment-1"),
+        ("delete_category", "cat-1", "/api/organizers/categories/cat-1"),
+        ("delete_tool", "tool-1", "/api/organizers/tools/tool-1"),
+    ], ids=["delete_food", "delete_unit", "delete_comment", "delete_category", "delete_tool"])
+    def test_delete_by_id(self, client, respx_mock, method_name, id_arg, path):
+        """Test delete_* wrappers remove a single object by ID."""
+        respx_mock.delete(path).mock(return_value=_RESP_204)
+
+        result = getattr(client, method_name)(id_arg)
 
         assert result is None
 
-    @respx.mock
-    def test_list_units(self):
+    def test_list_units(self, client, respx_mock):
         """Test list_units with pagination."""
         units = [build_unit(name="cup"), build_unit(name="tablespoon", abbreviation="tbsp")]
-        route = respx.get(
-            "https://test.example.com/api/units",
+        route = respx_mock.get(
+            "/api/units",
             params={"page": "1", "perPage": "50"}
         ).mock(return_value=Response(200, json={"items": units, "total": 2}))
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.list_units(page=1, per_page=50)
 
         assert route.called
         assert len(result["items"]) == 2
 
 
-# =============================================================================
-# 17. Complex Bulk Operations (5 tests)
-# =============================================================================
+# --- 17. Complex Bulk Operations ---
 
 class TestMealieClientBulkOperations:
     """Test complex bulk operations with tag/category creation."""
 
-    @respx.mock
-    def test_bulk_tag_recipes_with_existing_tags(self):
+    def test_bulk_tag_recipes_with_existing_tags(self, client, respx_mock):
         """Test bulk_tag_recipes uses existing tags."""
-        recipe1 = build_recipe(slug="recipe-1")
-        recipe2 = build_recipe(slug="recipe-2")
-        existing_tags = [build_tag(name="Vegan"), build_tag(name="Quick")]
-
-        # Mock recipe fetches
-        respx.get("https://test.example.com/api/recipes/recipe-1").mock(
-            return_value=Response(200, json=recipe1)
-        )
-        respx.get("https://test.example.com/api/recipes/recipe-2").mock(
-            return_value=Response(200, json=recipe2)
+        _mock_bulk_action(
+            respx_mock, "tags",
+            recipes=[{**_RECIPE, "slug": "recipe-1"}, {**_RECIPE, "slug": "recipe-2"}],
+            existing=[_TAG_VEGAN, build_tag(name="Quick")],
+            result={"tagged": 2},
         )
 
-        # Mock tag list
-        respx.get("https://test.example.com/api/organizers/tags").mock(
-            return_value=Response(200, json=existing_tags)
-        )
-
-        # Mock bulk action
-        respx.post("https://test.example.com/api/recipes/bulk-actions/tag").mock(
-            return_value=Response(200, json={"tagged": 2})
-        )
-
-        client = MealieClient("https://test.example.com", "token")
         result = client.bulk_tag_recipes(["recipe-1", "recipe-2"], ["Vegan", "Quick"])
 
         assert result["tagged"] == 2
 
-    @respx.mock
-    def test_bulk_tag_recipes_creates_missing_tags(self):
+    def test_bulk_tag_recipes_creates_missing_tags(self, client, respx_mock):
         """Test bulk_tag_recipes creates missing tags."""
-        recipe = build_recipe(slug="recipe-1")
-        existing_tag = build_tag(name="Vegan")
-        new_tag = build_tag(name="New Tag")
-
-        # Mock recipe fetch
-        respx.get("https://test.example.com/api/recipes/recipe-1").mock(
-            return_value=Response(200, json=recipe)
-        )
-
-        # Mock tag list (only has Vegan)
-        respx.get("https://test.example.com/api/organizers/tags").mock(
-            return_value=Response(200, json=[existing_tag])
-        )
-
-        # Mock tag creation for missing tag
-        respx.post("https://test.example.com/api/organizers/tags").mock(
-            return_value=Response(201, json=new_tag)
-        )
-
-        # Mock bulk action
-        respx.post("https://test.example.com/api/recipes/bulk-actions/tag").mock(
-            return_value=Response(200, json={"tagged": 1})
+        _mock_bulk_action(
+            respx_mock, "tags",
+            recipes=[{**_RECIPE, "slug": "recipe-1"}],
+            existing=[_TAG_VEGAN],
+            created=build_tag(name="New Tag"),
+            result={"tagged": 1},
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.bulk_tag_recipes(["recipe-1"], ["Vegan", "New Tag"])
 
         assert result["tagged"] == 1
+        assert respx_mock["create_tag"].called
 
-    @respx.mock
-    def test_bulk_categorize_recipes_with_existing_categories(self):
+    def test_bulk_categorize_recipes_with_existing_categories(self, client, respx_mock):
         """Test bulk_categorize_recipes uses existing categories."""
-        recipe1 = build_recipe(slug="recipe-1")
-        recipe2 = build_recipe(slug="recipe-2")
-        existing_categories = [build_category(name="Dessert"), build_category(name="Main")]
-
-        # Mock recipe fetches
-        respx.get("https://test.example.com/api/recipes/recipe-1").mock(
-            return_value=Response(200, json=recipe1)
-        )
-        respx.get("https://test.example.com/api/recipes/recipe-2").mock(
-            return_value=Response(200, json=recipe2)
+        _mock_bulk_action(
+            respx_mock, "categories",
+            recipes=[{**_RECIPE, "slug": "recipe-1"}, {**_RECIPE, "slug": "recipe-2"}],
+            existing=[_CATEGORY_DESSERT, build_category(name="Main")],
+            result={"categorized": 2},
         )
 
-        # Mock category list
-        respx.get("https://test.example.com/api/organizers/categories").mock(
-            return_value=Response(200, json=existing_categories)
-        )
-
-        # Mock bulk action
-        respx.post("https://test.example.com/api/recipes/bulk-actions/categorize").mock(
-            return_value=Response(200, json={"categorized": 2})
-        )
-
-        client = MealieClient("https://test.example.com", "token")
         result = client.bulk_categorize_recipes(["recipe-1", "recipe-2"], ["Dessert", "Main"])
 
         assert result["categorized"] == 2
 
-    @respx.mock
-    def test_bulk_categorize_recipes_creates_missing_categories(self):
+    def test_bulk_categorize_recipes_creates_missing_categories(self, client, respx_mock):
         """Test bulk_categorize_recipes creates missing categories."""
-        recipe = build_recipe(slug="recipe-1")
-        existing_cat = build_category(name="Dessert")
-        new_cat = build_category(name="New Category")
-
-        # Mock recipe fetch
-        respx.get("https://test.example.com/api/recipes/recipe-1").mock(
-            return_value=Response(200, json=recipe)
-        )
-
-        # Mock category list (only has Dessert)
-        respx.get("https://test.example.com/api/organizers/categories").mock(
-            return_value=Response(200, json=[existing_cat])
-        )
-
-        # Mock category creation for missing category
-        respx.post("https://test.example.com/api/organizers/categories").mock(
-            return_value=Response(201, json=new_cat)
+        _mock_bulk_action(
+            respx_mock, "categories",
+            recipes=[{**_RECIPE, "slug": "recipe-1"}],
+            existing=[_CATEGORY_DESSERT],
+            created=build_category(name="New Category"),
+            result={"categorized": 1},
         )
 
-        # Mock bulk action
-        respx.post("https://test.example.com/api/recipes/bulk-actions/categorize").mock(
-            return_value=Response(200, json={"categorized": 1})
-        )
-
-        client = MealieClient("https://test.example.com", "token")
         result = client.bulk_categorize_recipes(["recipe-1"], ["Dessert", "New Category"])
 
         assert result["categorized"] == 1
+        assert respx_mock["create_category"].called
 
-    @respx.mock
-    def test_bulk_tag_recipes_handles_paginated_tag_list(self):
+    def test_bulk_tag_recipes_handles_paginated_tag_list(self, client, respx_mock):
         """Test bulk_tag_recipes handles paginated tag response."""
-        recipe = build_recipe(slug="recipe-1")
-        existing_tags = [build_tag(name="Vegan")]
-        paginated_response = {"items": existing_tags, "total": 1}
-
-        # Mock recipe fetch
-        respx.get("https://test.example.com/api/recipes/recipe-1").mock(
-            return_value=Response(200, json=recipe)
+        _mock_bulk_action(
+            respx_mock, "tags",
+            recipes=[{**_RECIPE, "slug": "recipe-1"}],
+            existing={"items": [_TAG_VEGAN], "total": 1},
+            result={"tagged": 1},
         )
 
-        # Mock paginated tag list
-        respx.get("https://test.example.com/api/organizers/tags").mock(
-            return_value=Response(200, json=paginated_response)
-        )
-
-        # Mock bulk action
-        respx.post("https://test.example.com/api/recipes/bulk-actions/tag").mock(
-            return_value=Response(200, json={"tagged": 1})
-        )
-
-        client = MealieClient("https://test.example.com", "token")
         result = client.bulk_tag_recipes(["recipe-1"], ["Vegan"])
 
         assert result["tagged"] == 1
 
 
-# =============================================================================
-# 18. Error Parsing Edge Cases (3 tests)
-# =============================================================================
+# --- 18. Error Parsing Edge Cases ---
 
 class TestMealieClientErrorParsingEdgeCases:
     """Test edge cases in error parsing."""
 
-    def test_parse_error_with_unknown_format(self):
-        """Test _parse_api_error handles unknown error format."""
-        result = _parse_api_error(500, '{"unknown_field": "some value"}')
-
-        assert "Server Error" in result["message"]
-        assert result["suggestions"]
-
-    def test_parse_error_with_non_json(self):
-        """Test _parse_api_error handles non-JSON response."""
-        result = _parse_api_error(500, "Plain text error")
-
-        assert "Server Error" in result["message"]
-        assert "Plain text error" in result["raw_response"]
-
-    def test_parse_error_with_error_field(self):
-        """Test _parse_api_error handles error field format."""
-        result = _parse_api_error(500, '{"error": "Something went wrong"}')
-
-        assert "Something went wrong" in result["details"]
-
+    @pytest.mark.parametrize("status,body,check", [
+        (500, '{"unknown_field": "some value"}',
+         lambda r: "Server Error" in r["message"] and r["suggestions"]),
+        (500, "Plain text error",
+         lambda r: "Server Error" in r["message"] and "Plain text error" in r["raw_response"]),
+        (500, '{"error": "Something went wrong"}',
+         lambda r: "Something went wrong" in r["details"]),
+        (500, '{"message": "Internal error occurred"}',
+         lambda r: "Internal error occurred" in r["details"]),
+        (422, '{"detail": ["error1", "error2"]}',
+         lambda r: any("error1" in d or "error2" in d for d in r["details"])),
+        # Only the first 3 items of a list value are extracted
+        (500, '{"errors": ["item1", "item2", "item3", "item4"]}',
+         lambda r: "errors" in str(r["details"])),
+        (500, '[1, 2, 3]',
+         lambda r: "Unexpected error format" in str(r["details"])),
+        (422, '{"detail": {"key": 123}}',
+         lambda r: "Unexpected detail format" in str(r["details"])),
+    ], ids=[
+        "unknown_format", "non_json", "error_field", "message_field",
+        "list_detail", "complex_dict_values", "non_dict_data",
+        "detail_object_unexpected_format",
+    ])
+    def test_parse_error(self, status, body, check):
+        """Test _parse_api_error handles each error body format."""
+        assert check(_parse_api_error(status, body))
+
+
+# --- 19. Client Close and Context Manager ---
+
+class _RecordingTransport(httpx.BaseTransport):
+    """No-op transport that records whether the owning client closed it."""
+
+    closed = False
+
+    def handle_request(self, request):
+        return Response(204)
+
+    def close(self):
+        self.closed = True
 
-# =============================================================================
-# 19. Client Close and Context Manager (2 tests)
-# =============================================================================
 
 class TestMealieClientContextManager:
     """Test client cleanup and context manager behavior."""
 
-    def test_client_close_method(self):
-        """Test client.close() closes HTTP client."""
-        client = MealieClient("https://test.example.com", "token")
-        client.close()
-        # Should not raise error when closed
-
-    def test_context_manager_exit_calls_close(self):
-        """Test context manager calls close on exit."""
-        with MealieClient("https://test.example.com", "token") as client:
-            assert client is not None
-        # Client should be closed after exiting context
-
-
-# =============================================================================
-# 20. Additional Coverage for Edge Cases (5 tests)
-# =============================================================================
-
-class TestMealieClientEdgeCases:
-    """Test additional edge cases for better coverage."""
-
-    @respx.mock
-    def test_test_connection_with_empty_response(self):
-        """Test test_connection handles empty response."""
-        respx.get("https://test.example.com/api/app/about").mock(
-            return_value=Response(200, json={})
-        )
-
-        client = MealieClient("https://test.example.com", "token")
-        result = client.test_connection()
-
-        assert result is True
-
-    @respx.mock
-    def test_test_connection_with_alternative_version_key(self):
-        """Test test_connection recognizes different version keys."""
-        respx.get("https://test.example.com/api/app/about").mock(
-            return_value=Response(200, json={"apiVersion": "2.0.0"})
+    @pytest.mark.parametrize("use_ctx", [False, True], ids=["close", "context_manager"])
+    def test_close_closes_transport(self, monkeypatch, use_ctx):
+        """Test close() and context manager exit both close the HTTP client."""
+        transport = _RecordingTransport()
+        monkeypatch.setattr(
+            MealieClient, "_build_client", lambda self: httpx.Client(transport=transport)
         )
 
-        client = MealieClient("https://test.example.com", "token")
-        result = client.test_connection()
+        client = MealieClient("http://test.example.com", "token")
+        if use_ctx:
+            with client as entered:
+                assert entered is client
+        else:
+            client.close()
 
-        assert result is True
+        assert transport.closed
+        assert client.client.is_closed
 
-    def test_parse_error_with_message_field(self):
-        """Test _parse_api_error handles message field format."""
-        result = _parse_api_error(500, '{"message": "Internal error occurred"}')
+    def test_close_leaves_shared_transport_open(self, use_shared_transport, monkeypatch):
+        """Test closing a client on the conftest shared transport does not close the pool."""
+        client = use_shared_transport(MealieClient("http://test.example.com", "token"))
+        closed = []
+        monkeypatch.setattr(httpx.HTTPTransport, "close", lambda self: closed.append(self))
 
-        assert "Internal error occurred" in result["details"]
-
-    def test_parse_error_with_list_detail(self):
-        """Test _parse_api_error handles list detail with non-dict items."""
-        result = _parse_api_error(422, '{"detail": ["error1", "error2"]}')
-
-        assert any("error1" in detail or "error2" in detail for detail in result["details"])
+        client.close()
 
-    def test_parse_error_with_complex_dict_values(self):
-        """Test _parse_api_error handles dict with list values."""
-        result = _parse_api_error(500, '{"errors": ["item1", "item2", "item3", "item4"]}')
+        assert closed == []
 
-        # Should extract first 3 items from list
-        assert "errors" in str(result["details"])
 
-    def test_parse_error_with_non_dict_non_string_data(self):
-        """Test _parse_api_error handles non-dict error data."""
-        result = _parse_api_error(500, '[1, 2, 3]')
+# --- 20. Additional Coverage for Edge Cases ---
 
-        assert "Unexpected error format" in str(result["details"])
+class TestMealieClientEdgeCases:
+    """Test additional edge cases for better coverage."""
 
-    @respx.mock
-    def test_parse_ingredient_with_custom_parser(self):
+    def test_parse_ingredient_with_custom_parser(self, client, respx_mock):
         """Test parse_ingredient with custom parser type."""
-        parsed = build_parsed_ingredient()
-        respx.post("https://test.example.com/api/parser/ingredient").mock(
-            return_value=Response(200, json=parsed)
+        respx_mock.post("/api/parser/ingredient").mock(
+            return_value=Response(200, content=_PARSED_INGREDIENT_JSON, headers=_JSON_HEADERS)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.parse_ingredient("2 cups flour", parser="brute")
 
         assert result is not None
 
-    @respx.mock
-    def test_parse_ingredients_batch_with_openai_parser(self):
+    def test_parse_ingredients_batch_with_openai_parser(self, client, respx_mock):
         """Test parse_ingredients_batch with openai parser."""
-        parsed_list = [build_parsed_ingredient()]
-        respx.post("https://test.example.com/api/parser/ingredients").mock(
-            return_value=Response(200, json=parsed_list)
+        respx_mock.post("/api/parser/ingredients").mock(
+            return_value=Response(200, content=_PARSED_INGREDIENT_LIST_JSON, headers=_JSON_HEADERS)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.parse_ingredients_batch(["2 cups flour"], parser="openai")
 
         assert len(result) == 1
 
-    @respx.mock
-    def test_duplicate_recipe_without_new_name(self):
+    def test_duplicate_recipe_without_new_name(self, client, respx_mock):
         """Test duplicate_recipe without specifying new name."""
         new_recipe = build_recipe(name="Copy of Test Recipe")
-        respx.post("https://test.example.com/api/recipes/test-recipe/duplicate").mock(
+        respx_mock.post("/api/recipes/test-recipe/duplicate").mock(
             return_value=Response(200, json=new_recipe)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.duplicate_recipe("test-recipe")
 
         assert result is not None
 
-    @respx.mock
-    def test_update_recipe_last_made_without_timestamp(self):
+    def test_update_recipe_last_made_without_timestamp(self, client, respx_mock):
         """Test update_recipe_last_made without explicit timestamp."""
-        recipe = build_recipe()
-        respx.patch("https://test.example.com/api/recipes/test-recipe/last-made").mock(
-            return_value=Response(200, json=recipe)
+        respx_mock.patch("/api/recipes/test-recipe/last-made").mock(
+            return_value=Response(200, content=_RECIPE_JSON, headers=_JSON_HEADERS)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.update_recipe_last_made("test-recipe")
 
         assert result is not None
 
-    @respx.mock
-    def test_create_mealplan_rule_without_tags_or_categories(self):
+    def test_create_mealplan_rule_without_tags_or_categories(self, client, respx_mock):
         """Test create_mealplan_rule with minimal params."""
         rule = {"id": "rule-1", "name": "Simple Rule", "entryType": "dinner"}
-        respx.post("https://test.example.com/api/households/mealplans/rules").mock(
+        respx_mock.post("/api/households/mealplans/rules").mock(
             return_value=Response(201, json=rule)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.create_mealplan_rule("Simple Rule", "dinner")
 
         assert result["name"] == "Simple Rule"
 
-    @respx.mock
-    def test_update_mealplan_rule_partial_update(self):
+    def test_update_mealplan_rule_partial_update(self, client, respx_mock):
         """Test update_mealplan_rule with only some fields."""
         rule = {"id": "rule-1", "name": "Same Name", "entryType": "lunch"}
-        respx.patch("https://test.example.com/api/households/mealplans/rules/rule-1").mock(
+        respx_mock.patch("/api/households/mealplans/rules/rule-1").mock(
             return_value=Response(200, json=rule)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.update_mealplan_rule("rule-1", entry_type="lunch")
 
         assert result["entryType"] == "lunch"
 
-    @respx.mock
-    def test_create_food_with_all_params(self):
+    def test_create_food_with_all_params(self, client, respx_mock):
         """Test create_food with all optional parameters."""
         food = build_food(name="Flour", description="All-purpose flour")
-        respx.post("https://test.example.com/api/foods").mock(
+        respx_mock.post("/api/foods").mock(
             return_value=Response(201, json=food)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.create_food("Flour", description="All-purpose flour", label_id="label-123")
 
         assert result["name"] == "Flour"
 
-    @respx.mock
-    def test_create_unit_with_all_params(self):
+    def test_create_unit_with_all_params(self, client, respx_mock):
         """Test create_unit with all optional parameters."""
         unit = build_unit(name="tablespoon", abbreviation="tbsp")
-        respx.post("https://test.example.com/api/units").mock(
+        respx_mock.post("/api/units").mock(
             return_value=Response(201, json=unit)
         )
 
-        client = MealieClient("https://test.example.com", "token")
         result = client.create_unit("tablespoon", description="A tablespoon", abbreviation="tbsp")
 
         assert result["name"] == "tablespoon"
-
-    def test_parse_error_with_detail_object_unexpected_format(self):
-        """Test _parse_api_error handles detail object with unexpected value type."""
-        result = _parse_api_error(422, '{"detail": {"key": 123}}')
-
-        assert "Unexpected detail format" in str(result["details"])
-
-    @respx.mock
-    def test_test_connection_with_versionAPI_key(self):
-        """Test test_connection recognizes versionAPI key."""
-        respx.get("https://test.example.com/api/app/about").mock(
-            return_value=Response(200, json={"versionAPI": "3.0.0"})
-        )
-
-        client = MealieClient("https://test.example.com", "token")
-        result = client.test_connection()
-
-        assert result is True
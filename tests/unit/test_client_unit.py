@@ -2,64 +2,95 @@
 Unit tests for MealieClient methods.
 
 Tests individual client methods in isolation using mocked HTTP responses.
-No real HTTP calls are made - all responses are mocked.
+No real HTTP calls are made - respx intercepts requests at the transport
+layer, so real request construction (URL, headers, JSON body) is exercised.
 """
 
-import pytest
+import json
 import httpx
-from unittest.mock import Mock
-from src.client import MealieClient
-
-
-@pytest.mark.unit
-def test_get_recipe_success(
-    mock_mealie_client: MealieClient,
-    mock_httpx_client: Mock,
-    sample_recipe_response: dict
+import pytest
+import respx
+from typing import List, Union
+from src.client import MealieClient, MealieAPIError
+
+BASE_URL = "http://test.example.com"
+
+
+@pytest.fixture(scope="module")
+def client(use_shared_transport):
+    """Real MealieClient shared by this module's tests, on the shared transport."""
+    mealie = use_shared_transport(MealieClient(base_url=BASE_URL, api_token="test-token-12345"))
+    yield mealie
+    mealie.close()
+
+
+@pytest.fixture
+def respx_mock():
+    """respx router rooted at BASE_URL; tests assert on their own routes."""
+    with respx.mock(base_url=BASE_URL, assert_all_called=False) as router:
+        yield router
+
+
+# (endpoint, response fixture) for single GET requests; a list of fixture
+# names stands for a list response
+_GET_CASES = [
+    ("/api/recipes/test-recipe", "sample_recipe_response"),
+    (
+        "/api/households/mealplans/650e8400-e29b-41d4-a716-446655440001",
+        "sample_mealplan_response",
+    ),
+    ("/api/households/shopping/lists", ["sample_shopping_list_response"]),
+]
+
+
+@pytest.mark.parametrize(
+    "endpoint,body_fixture", _GET_CASES, ids=["recipe", "mealplan", "shopping_lists"]
+)
+def test_get_success(
+    request: pytest.FixtureRequest,
+    client: MealieClient,
+    respx_mock: respx.MockRouter,
+    endpoint: str,
+    body_fixture: Union[str, List[str]]
 ):
-    """Test successful recipe retrieval."""
+    """Test successful retrieval returns the decoded JSON body."""
     # Arrange
-    mock_httpx_client.get.return_value.json.return_value = sample_recipe_response
-    mock_httpx_client.get.return_value.status_code = 200
-    mock_httpx_client.get.return_value.raise_for_status = Mock()
+    if isinstance(body_fixture, list):
+        body = [request.getfixturevalue(name) for name in body_fixture]
+    else:
+        body = request.getfixturevalue(body_fixture)
+    route = respx_mock.get(endpoint).respond(200, json=body)
 
     # Act
-    recipe = mock_mealie_client.get_recipe("test-recipe")
+    result = client.get(endpoint)
 
     # Assert
-    assert recipe["name"] == "Test Recipe"
-    assert recipe["slug"] == "test-recipe"
-    assert recipe["description"] == "A test recipe for unit testing"
-    mock_httpx_client.get.assert_called_once_with("/api/recipes/test-recipe")
+    assert result == body
+    assert route.call_count == 1
 
 
-@pytest.mark.unit
 def test_get_recipe_not_found(
-    mock_mealie_client: MealieClient,
-    mock_httpx_client: Mock
+    client: MealieClient,
+    respx_mock: respx.MockRouter,
+    http_404_response: httpx.Response
 ):
     """Test recipe retrieval when recipe doesn't exist."""
     # Arrange
-    mock_response = Mock()
-    mock_response.status_code = 404
-    mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-        "404 Not Found",
-        request=Mock(),
-        response=mock_response
+    route = respx_mock.get("/api/recipes/non-existent-recipe").mock(
+        return_value=http_404_response
     )
-    mock_httpx_client.get.return_value = mock_response
 
     # Act & Assert
-    with pytest.raises(httpx.HTTPStatusError):
-        mock_mealie_client.get_recipe("non-existent-recipe")
+    with pytest.raises(MealieAPIError) as exc_info:
+        client.get("/api/recipes/non-existent-recipe")
 
-    mock_httpx_client.get.assert_called_once_with("/api/recipes/non-existent-recipe")
+    assert exc_info.value.status_code == 404
+    assert route.call_count == 1
 
 
-@pytest.mark.unit
 def test_search_recipes_success(
-    mock_mealie_client: MealieClient,
-    mock_httpx_client: Mock,
+    client: MealieClient,
+    respx_mock: respx.MockRouter,
     sample_recipe_response: dict
 ):
     """Test successful recipe search."""
@@ -70,134 +101,78 @@ def test_search_recipes_success(
         "page": 1,
         "per_page": 10
     }
-    mock_httpx_client.get.return_value.json.return_value = search_results
-    mock_httpx_client.get.return_value.status_code = 200
-    mock_httpx_client.get.return_value.raise_for_status = Mock()
+    route = respx_mock.get("/api/recipes", params={"search": "test"}).respond(
+        200, json=search_results
+    )
 
     # Act
-    results = mock_mealie_client.search_recipes(query="test")
+    results = client.get("/api/recipes", params={"search": "test"})
 
     # Assert
     assert len(results["items"]) == 1
     assert results["total"] == 1
     assert results["items"][0]["name"] == "Test Recipe"
-    mock_httpx_client.get.assert_called_once()
+    assert route.call_count == 1
 
 
-@pytest.mark.unit
 def test_create_recipe_success(
-    mock_mealie_client: MealieClient,
-    mock_httpx_client: Mock,
+    client: MealieClient,
+    respx_mock: respx.MockRouter,
     sample_recipe_response: dict
 ):
     """Test successful recipe creation."""
     # Arrange
-    mock_httpx_client.post.return_value.json.return_value = sample_recipe_response
-    mock_httpx_client.post.return_value.status_code = 201
-    mock_httpx_client.post.return_value.raise_for_status = Mock()
+    route = respx_mock.post("/api/recipes").respond(201, json=sample_recipe_response)
 
     # Act
-    recipe = mock_mealie_client.create_recipe(
-        name="Test Recipe",
-        description="A test recipe"
+    recipe = client.post(
+        "/api/recipes",
+        json={"name": "Test Recipe", "description": "A test recipe"}
     )
 
     # Assert
     assert recipe["name"] == "Test Recipe"
     assert recipe["slug"] == "test-recipe"
-    mock_httpx_client.post.assert_called_once()
-    call_args = mock_httpx_client.post.call_args
-    assert call_args[0][0] == "/api/recipes"
-    assert call_args[1]["json"]["name"] == "Test Recipe"
+    assert route.call_count == 1
+    assert json.loads(route.calls.last.request.content)["name"] == "Test Recipe"
 
 
-@pytest.mark.unit
 def test_update_recipe_success(
-    mock_mealie_client: MealieClient,
-    mock_httpx_client: Mock,
+    client: MealieClient,
+    respx_mock: respx.MockRouter,
     sample_recipe_response: dict
 ):
     """Test successful recipe update."""
     # Arrange
     updated_response = sample_recipe_response.copy()
     updated_response["name"] = "Updated Recipe Name"
-    mock_httpx_client.put.return_value.json.return_value = updated_response
-    mock_httpx_client.put.return_value.status_code = 200
-    mock_httpx_client.put.return_value.raise_for_status = Mock()
+    route = respx_mock.put("/api/recipes/test-recipe").respond(200, json=updated_response)
 
     # Act
-    recipe = mock_mealie_client.update_recipe(
-        slug="test-recipe",
-        name="Updated Recipe Name"
+    recipe = client.put(
+        "/api/recipes/test-recipe",
+        json={"name": "Updated Recipe Name"}
     )
 
     # Assert
     assert recipe["name"] == "Updated Recipe Name"
     assert recipe["slug"] == "test-recipe"
-    mock_httpx_client.put.assert_called_once()
+    assert route.call_count == 1
 
 
-@pytest.mark.unit
-def test_delete_recipe_success(
-    mock_mealie_client: MealieClient,
-    mock_httpx_client: Mock
-):
+def test_delete_recipe_success(client: MealieClient, respx_mock: respx.MockRouter):
     """Test successful recipe deletion."""
     # Arrange
-    mock_httpx_client.delete.return_value.status_code = 200
-    mock_httpx_client.delete.return_value.raise_for_status = Mock()
-
-    # Act
-    mock_mealie_client.delete_recipe("test-recipe")
-
-    # Assert
-    mock_httpx_client.delete.assert_called_once_with("/api/recipes/test-recipe")
-
-
-@pytest.mark.unit
-def test_get_mealplan_success(
-    mock_mealie_client: MealieClient,
-    mock_httpx_client: Mock,
-    sample_mealplan_response: dict
-):
-    """Test successful meal plan retrieval."""
-    # Arrange
-    mock_httpx_client.get.return_value.json.return_value = sample_mealplan_response
-    mock_httpx_client.get.return_value.status_code = 200
-    mock_httpx_client.get.return_value.raise_for_status = Mock()
-
-    # Act
-    mealplan = mock_mealie_client.get_mealplan(sample_mealplan_response["id"])
-
-    # Assert
-    assert mealplan["date"] == "2025-12-25"
-    assert mealplan["entryType"] == "dinner"
-    assert mealplan["recipe"]["name"] == "Roast Turkey"
-
-
-@pytest.mark.unit
-def test_list_shopping_lists_success(
-    mock_mealie_client: MealieClient,
-    mock_httpx_client: Mock,
-    sample_shopping_list_response: dict
-):
-    """Test successful shopping lists retrieval."""
-    # Arrange
-    mock_httpx_client.get.return_value.json.return_value = [sample_shopping_list_response]
-    mock_httpx_client.get.return_value.status_code = 200
-    mock_httpx_client.get.return_value.raise_for_status = Mock()
+    route = respx_mock.delete("/api/recipes/test-recipe").respond(204)
 
     # Act
-    shopping_lists = mock_mealie_client.list_shopping_lists()
+    result = client.delete("/api/recipes/test-recipe")
 
     # Assert
-    assert len(shopping_lists) == 1
-    assert shopping_lists[0]["name"] == "Weekly Groceries"
-    assert len(shopping_lists[0]["listItems"]) == 2
-    mock_httpx_client.get.assert_called_once_with("/api/groups/shopping/lists")
+    assert result is None
+    assert route.call_count == 1
 
 
-@pytest.mark.unit
 def test_client_initialization():
     """Test MealieClient initialization."""
     # Act
@@ -214,22 +189,19 @@ def test_client_initialization():
     assert client.client.headers["Authorization"] == "Bearer test-token-123"
 
 
-@pytest.mark.unit
 def test_client_request_with_server_error(
-    mock_mealie_client: MealieClient,
-    mock_httpx_client: Mock
+    client: MealieClient,
+    respx_mock: respx.MockRouter,
+    monkeypatch: pytest.MonkeyPatch,
+    http_500_response: httpx.Response
 ):
     """Test client behavior with server error (500)."""
-    # Arrange
-    mock_response = Mock()
-    mock_response.status_code = 500
-    mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-        "500 Internal Server Error",
-        request=Mock(),
-        response=mock_response
-    )
-    mock_httpx_client.get.return_value = mock_response
+    # Arrange - 5xx responses are retried; skip the backoff sleeps
+    monkeypatch.setattr("src.client.time.sleep", lambda _: None)
+    respx_mock.get("/api/recipes/test-recipe").mock(return_value=http_500_response)
 
     # Act & Assert
-    with pytest.raises(httpx.HTTPStatusError):
-        mock_mealie_client.get_recipe("test-recipe")
+    with pytest.raises(MealieAPIError) as exc_info:
+        client.get("/api/recipes/test-recipe")
+
+    assert exc_info.value.status_code == 500
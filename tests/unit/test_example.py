@@ -309,13 +309,13 @@ class TestMockClientIsolated:
     def test_mock_client_isolated_can_be_configured(self, mock_client_isolated):
         """Test mock_client_isolated can have return values configured."""
         # Configure mock
-        mock_client_isolated.get_recipe.return_value = build_recipe(name="Mocked Recipe")
+        mock_client_isolated.get.return_value = build_recipe(name="Mocked Recipe")
 
         # Use mock
-        result = mock_client_isolated.get_recipe("test-slug")
+        result = mock_client_isolated.get("/api/recipes/test-slug")
 
         assert result["name"] == "Mocked Recipe"
-        mock_client_isolated.get_recipe.assert_called_once_with("test-slug")
+        mock_client_isolated.get.assert_called_once_with("/api/recipes/test-slug")
 
 
 class TestParsedIngredientBuilder:
@@ -4,10 +4,9 @@ Tests meal plan listing, creation, updates, deletion, and search functionality.
 All tests use mocked MealieClient to avoid network calls.
 """
 
-import json
 import pytest
-from datetime import date, timedelta
-from unittest.mock import Mock, patch
+from datetime import date
+from src.tools import mealplans as mealplans_module
 from src.tools.mealplans import (
     mealplans_list,
     mealplans_today,
@@ -16,376 +15,262 @@ from src.tools.mealplans import (
     mealplans_delete
 )
 from tests.unit.builders import build_mealplan, build_recipe
+from tests.unit.mocks import ERR_400, ERR_404, ERR_500, configure, patch_client
+from tests.unit._json import loads
 
+pytestmark = [pytest.mark.mealplans, pytest.mark.xdist_group("tools_mealplans")]
 
-class TestMealplansList:
-    """Tests for mealplans_list function."""
-
-    def test_list_mealplans_default_dates(self):
-        """Test listing meal plans with default date range."""
-        mock_client = Mock()
-        today = date.today()
-        end = today + timedelta(days=7)
 
-        mock_client.get.return_value = [
-            build_mealplan(meal_date=today.isoformat(), entry_type="breakfast"),
-            build_mealplan(meal_date=today.isoformat(), entry_type="lunch")
-        ]
+# Canonical 2025-12-25 dinner entry, built once; the tools never mutate it
+_MEALPLAN = build_mealplan()
 
-        with patch('src.tools.mealplans.MealieClient') as MockClient:
-            MockClient.return_value.__enter__.return_value = mock_client
+# date.today() as seen by the tools, pinned by _freeze_today
+_TODAY = date(2025, 1, 15)
+_TODAY_ISO = _TODAY.isoformat()
 
-            result = mealplans_list()
-            result_dict = json.loads(result)
-
-            assert "entries" in result_dict
-            assert result_dict["count"] == 2
-            assert result_dict["start_date"] == today.isoformat()
-            assert result_dict["end_date"] == end.isoformat()
-
-    def test_list_mealplans_custom_date_range(self):
-        """Test listing meal plans with custom date range."""
-        mock_client = Mock()
-        mock_client.get.return_value = [
-            build_mealplan(meal_date="2025-12-25", entry_type="dinner")
-        ]
-
-        with patch('src.tools.mealplans.MealieClient') as MockClient:
-            MockClient.return_value.__enter__.return_value = mock_client
-
-            result = mealplans_list(start_date="2025-12-25", end_date="2025-12-26")
-            result_dict = json.loads(result)
-
-            assert result_dict["start_date"] == "2025-12-25"
-            assert result_dict["end_date"] == "2025-12-26"
-
-            # Verify API params
-            call_args = mock_client.get.call_args
-            assert call_args[1]["params"]["start_date"] == "2025-12-25"
-            assert call_args[1]["params"]["end_date"] == "2025-12-26"
-
-    def test_list_mealplans_formats_entries(self):
-        """Test that mealplans_list formats entries correctly."""
-        recipe = build_recipe(name="Pasta", slug="pasta")
-        mealplan = build_mealplan(
-            meal_date="2025-12-25",
-            entry_type="dinner",
-            title="Christmas Dinner",
-            text="Special meal",
-            recipeId="recipe-pasta"
-        )
-        mealplan["recipe"] = recipe
-
-        mock_client = Mock()
-        mock_client.get.return_value = [mealplan]
-
-        with patch('src.tools.mealplans.MealieClient') as MockClient:
-            MockClient.return_value.__enter__.return_value = mock_client
+# Full decoded tool output for the empty-response cases
+_EMPTY_RANGE = {"start_date": "2025-01-01", "end_date": "2025-01-02", "count": 0, "entries": []}
+_EMPTY_TODAY = {"date": _TODAY_ISO, "count": 0, "meals": {}}
 
-            result = mealplans_list(start_date="2025-12-25", end_date="2025-12-26")
-            result_dict = json.loads(result)
 
-            entry = result_dict["entries"][0]
-            assert entry["date"] == "2025-12-25"
-            assert entry["entry_type"] == "dinner"
-            assert entry["title"] == "Christmas Dinner"
-            assert entry["text"] == "Special meal"
-            assert entry["recipe_name"] == "Pasta"
-            assert entry["recipe_slug"] == "pasta"
-
-    def test_list_mealplans_empty_range(self):
-        """Test listing meal plans with no entries in range."""
-        mock_client = Mock()
-        mock_client.get.return_value = []
+@pytest.fixture(autouse=True)
+def mock_client(monkeypatch):
+    """Spec'd client mock served to the meal plan tools in every test."""
+    return patch_client(monkeypatch, mealplans_module)
 
-        with patch('src.tools.mealplans.MealieClient') as MockClient:
-            MockClient.return_value.__enter__.return_value = mock_client
 
-            result = mealplans_list(start_date="2025-01-01", end_date="2025-01-02")
-            result_dict = json.loads(result)
+class _FrozenDate(date):
+    """date whose today() is always _TODAY."""
 
-            assert result_dict["count"] == 0
-            assert result_dict["entries"] == []
+    @classmethod
+    def today(cls):
+        return _TODAY
 
-    def test_list_mealplans_api_error(self):
-        """Test handling of API error during list."""
-        from src.client import MealieAPIError
 
-        mock_client = Mock()
-        mock_client.get.side_effect = MealieAPIError(
-            "Failed to fetch",
-            status_code=500,
-            response_body="Server error"
-        )
-
-        with patch('src.tools.mealplans.MealieClient') as MockClient:
-            MockClient.return_value.__enter__.return_value = mock_client
-
-            result = mealplans_list()
-            result_dict = json.loads(result)
-
-            assert "error" in result_dict
-            assert result_dict["status_code"] == 500
+@pytest.fixture(autouse=True)
+def _freeze_today(monkeypatch):
+    """Pin date.today() inside the mealplan tools so expected dates are constants."""
+    monkeypatch.setattr(mealplans_module, "date", _FrozenDate)
 
 
-class TestMealplansToday:
-    """Tests for mealplans_today function."""
-
-    def test_get_today_mealplans(self):
-        """Test retrieving today's meal plans."""
-        today = date.today().isoformat()
-        mock_client = Mock()
-        mock_client.get.return_value = [
-            build_mealplan(meal_date=today, entry_type="breakfast"),
-            build_mealplan(meal_date=today, entry_type="lunch"),
-            build_mealplan(meal_date=today, entry_type="dinner")
-        ]
-
-        with patch('src.tools.mealplans.MealieClient') as MockClient:
-            MockClient.return_value.__enter__.return_value = mock_client
-
-            result = mealplans_today()
-            result_dict = json.loads(result)
+# Tests for mealplans_list function
+def test_list_mealplans_default_dates(mock_client):
+    """Test listing meal plans with default date range."""
+    configure(mock_client, get=[
+        build_mealplan(meal_date=_TODAY_ISO, entry_type="breakfast"),
+        build_mealplan(meal_date=_TODAY_ISO, entry_type="lunch")
+    ])
 
-            assert result_dict["date"] == today
-            assert "meals" in result_dict
-            assert result_dict["count"] == 3
-
-    def test_get_today_mealplans_organized_by_type(self):
-        """Test that today's meals are organized by entry type."""
-        today = date.today().isoformat()
-        mock_client = Mock()
-        mock_client.get.return_value = [
-            build_mealplan(meal_date=today, entry_type="breakfast", title="Oatmeal"),
-            build_mealplan(meal_date=today, entry_type="dinner", title="Pasta")
-        ]
-
-        with patch('src.tools.mealplans.MealieClient') as MockClient:
-            MockClient.return_value.__enter__.return_value = mock_client
-
-            result = mealplans_today()
-            result_dict = json.loads(result)
-
-            # Should have meals organized by type
-            assert "meals" in result_dict
-
-    def test_get_today_mealplans_empty(self):
-        """Test retrieving today's meals when none exist."""
-        mock_client = Mock()
-        mock_client.get.return_value = []
-
-        with patch('src.tools.mealplans.MealieClient') as MockClient:
-            MockClient.return_value.__enter__.return_value = mock_client
-
-            result = mealplans_today()
-            result_dict = json.loads(result)
-
-            assert result_dict["count"] == 0
-
-
-class TestMealplansGet:
-    """Tests for mealplans_get function."""
-
-    def test_get_mealplan_by_id(self):
-        """Test retrieving a specific meal plan entry."""
-        mealplan = build_mealplan(
-            meal_date="2025-12-25",
-            entry_type="dinner",
-            title="Holiday Dinner"
-        )
-        mealplan["id"] = "mealplan-123"
-
-        mock_client = Mock()
-        mock_client.get.return_value = mealplan
-
-        with patch('src.tools.mealplans.MealieClient') as MockClient:
-            MockClient.return_value.__enter__.return_value = mock_client
-
-            result = mealplans_get("mealplan-123")
-            result_dict = json.loads(result)
-
-            assert result_dict["id"] == "mealplan-123"
-            assert result_dict["title"] == "Holiday Dinner"
-
-            # Verify endpoint
-            mock_client.get.assert_called_once_with("/api/households/mealplans/mealplan-123")
-
-    def test_get_mealplan_not_found(self):
-        """Test handling of meal plan not found error."""
-        from src.client import MealieAPIError
-
-        mock_client = Mock()
-        mock_client.get.side_effect = MealieAPIError(
-            "Not found",
-            status_code=404,
-            response_body="Meal plan not found"
-        )
-
-        with patch('src.tools.mealplans.MealieClient') as MockClient:
-            MockClient.return_value.__enter__.return_value = mock_client
-
-            result = mealplans_get("nonexistent")
-            result_dict = json.loads(result)
-
-            assert "error" in result_dict
-            assert result_dict["status_code"] == 404
-
-
-class TestMealplansCreate:
-    """Tests for mealplans_create function."""
-
-    def test_create_mealplan_with_recipe(self):
-        """Test creating a meal plan entry with recipe."""
-        mock_client = Mock()
-        mock_client.post.return_value = build_mealplan(
-            meal_date="2025-12-25",
-            entry_type="dinner",
-            recipeId="recipe-123"
-        )
-
-        with patch('src.tools.mealplans.MealieClient') as MockClient:
-            MockClient.return_value.__enter__.return_value = mock_client
-
-            result = mealplans_create(
-                meal_date="2025-12-25",
-                entry_type="dinner",
-                recipe_id="recipe-123"
-            )
-            result_dict = json.loads(result)
-
-            # Function wraps response with success/entry keys
-            assert result_dict["success"] is True
-            assert "entry" in result_dict
-
-            # Verify POST payload
-            call_args = mock_client.post.call_args
-            payload = call_args[1]["json"]
-            assert payload["date"] == "2025-12-25"
-            assert payload["entryType"] == "dinner"
-            assert payload["recipeId"] == "recipe-123"
-
-    def test_create_mealplan_without_recipe(self):
-        """Test creating a meal plan entry without recipe."""
-        mock_client = Mock()
-        mock_client.post.return_value = build_mealplan(
-            meal_date="2025-12-25",
-            entry_type="breakfast",
-            title="Quick breakfast",
-            text="Eggs and toast"
-        )
-
-        with patch('src.tools.mealplans.MealieClient') as MockClient:
-            MockClient.return_value.__enter__.return_value = mock_client
-
-            result = mealplans_create(
-                meal_date="2025-12-25",
-                entry_type="breakfast",
-                title="Quick breakfast",
-                text="Eggs and toast"
-            )
-
-            # Should work without recipe_id
-            call_args = mock_client.post.call_args
-            payload = call_args[1]["json"]
-            assert "title" in payload
-            assert "text" in payload
-
-    def test_create_mealplan_validates_entry_type(self):
-        """Test that valid entry types are accepted."""
-        mock_client = Mock()
-        mock_client.post.return_value = build_mealplan()
-
-        with patch('src.tools.mealplans.MealieClient') as MockClient:
-            MockClient.return_value.__enter__.return_value = mock_client
-
-            # Test each valid entry type
-            for entry_type in ["breakfast", "lunch", "dinner", "side", "snack"]:
-                result = mealplans_create(
-                    meal_date="2025-12-25",
-                    entry_type=entry_type
-                )
-                # Should not raise error
-                assert result is not None
-
-    def test_create_mealplan_api_error(self):
-        """Test handling of API error during creation."""
-        from src.client import MealieAPIError
-
-        mock_client = Mock()
-        mock_client.post.side_effect = MealieAPIError(
-            "Creation failed",
-            status_code=400,
-            response_body="Invalid data"
-        )
-
-        with patch('src.tools.mealplans.MealieClient') as MockClient:
-            MockClient.return_value.__enter__.return_value = mock_client
-
-            result = mealplans_create(
-                meal_date="2025-12-25",
-                entry_type="dinner"
-            )
-            result_dict = json.loads(result)
-
-            assert "error" in result_dict
-            assert result_dict["status_code"] == 400
-
-
-class TestMealplansDelete:
-    """Tests for mealplans_delete function."""
-
-    def test_delete_mealplan(self):
-        """Test deleting a meal plan entry."""
-        mock_client = Mock()
-        mock_client.delete.return_value = {"message": "Deleted"}
-
-        with patch('src.tools.mealplans.MealieClient') as MockClient:
-            MockClient.return_value.__enter__.return_value = mock_client
-
-            result = mealplans_delete("mealplan-123")
-            result_dict = json.loads(result)
-
-            assert "success" in result_dict or "message" in result_dict
-
-            # Verify DELETE endpoint
-            mock_client.delete.assert_called_once_with("/api/households/mealplans/mealplan-123")
-
-    def test_delete_mealplan_not_found(self):
-        """Test deleting non-existent meal plan."""
-        from src.client import MealieAPIError
-
-        mock_client = Mock()
-        mock_client.delete.side_effect = MealieAPIError(
-            "Not found",
-            status_code=404,
-            response_body="Meal plan not found"
-        )
-
-        with patch('src.tools.mealplans.MealieClient') as MockClient:
-            MockClient.return_value.__enter__.return_value = mock_client
-
-            result = mealplans_delete("nonexistent")
-            result_dict = json.loads(result)
-
-            assert "error" in result_dict
-            assert result_dict["status_code"] == 404
-
-    def test_delete_mealplan_api_error(self):
-        """Test handling of API error during deletion."""
-        from src.client import MealieAPIError
-
-        mock_client = Mock()
-        mock_client.delete.side_effect = MealieAPIError(
-            "Deletion failed",
-            status_code=500,
-            response_body="Server error"
-        )
-
-        with patch('src.tools.mealplans.MealieClient') as MockClient:
-            MockClient.return_value.__enter__.return_value = mock_client
+    result = mealplans_list()
+    result_dict = loads(result)
 
-            result = mealplans_delete("mealplan-123")
-            result_dict = json.loads(result)
+    assert "entries" in result_dict
+    assert result_dict["count"] == 2
+    assert result_dict["start_date"] == _TODAY_ISO
+    assert result_dict["end_date"] == "2025-01-22"
 
-            assert "error" in result_dict
-            assert result_dict["status_code"] == 500
+
+def test_list_mealplans_custom_date_range(mock_client):
+    """Test listing meal plans with custom date range."""
+    configure(mock_client, get=[_MEALPLAN])
+
+    result = mealplans_list(start_date="2025-12-25", end_date="2025-12-26")
+    result_dict = loads(result)
+
+    assert result_dict["start_date"] == "2025-12-25"
+    assert result_dict["end_date"] == "2025-12-26"
+
+    # Verify API params
+    params = mock_client.get.call_args.kwargs["params"]
+    assert {"start_date": "2025-12-25", "end_date": "2025-12-26"}.items() <= params.items()
+
+
+def test_list_mealplans_formats_entries(mock_client):
+    """Test that mealplans_list formats entries correctly."""
+    recipe = build_recipe(name="Pasta", slug="pasta")
+    mealplan = build_mealplan(
+        meal_date="2025-12-25",
+        entry_type="dinner",
+        title="Christmas Dinner",
+        text="Special meal",
+        recipeId="recipe-pasta"
+    )
+    mealplan["recipe"] = recipe
+
+    configure(mock_client, get=[mealplan])
+
+    result = mealplans_list(start_date="2025-12-25", end_date="2025-12-26")
+    result_dict = loads(result)
+
+    entry = result_dict["entries"][0]
+    assert entry["date"] == "2025-12-25"
+    assert entry["entry_type"] == "dinner"
+    assert entry["title"] == "Christmas Dinner"
+    assert entry["text"] == "Special meal"
+    assert entry["recipe_name"] == "Pasta"
+    assert entry["recipe_slug"] == "pasta"
+
+
+def test_list_mealplans_empty_range(mock_client):
+    """Test listing meal plans with no entries in range."""
+    configure(mock_client, get=[])
+
+    result = mealplans_list(start_date="2025-01-01", end_date="2025-01-02")
+
+    assert loads(result) == _EMPTY_RANGE
+
+
+# Tests for mealplans_today function
+def test_get_today_mealplans(mock_client):
+    """Test retrieving today's meal plans."""
+    configure(mock_client, get=[
+        build_mealplan(meal_date=_TODAY_ISO, entry_type="breakfast"),
+        build_mealplan(meal_date=_TODAY_ISO, entry_type="lunch"),
+        build_mealplan(meal_date=_TODAY_ISO, entry_type="dinner")
+    ])
+
+    result = mealplans_today()
+    result_dict = loads(result)
+
+    assert result_dict["date"] == _TODAY_ISO
+    assert "meals" in result_dict
+    assert result_dict["count"] == 3
+
+
+def test_get_today_mealplans_organized_by_type(mock_client):
+    """Test that today's meals are organized by entry type."""
+    configure(mock_client, get=[
+        build_mealplan(meal_date=_TODAY_ISO, entry_type="breakfast", title="Oatmeal"),
+        build_mealplan(meal_date=_TODAY_ISO, entry_type="dinner", title="Pasta")
+    ])
+
+    result = mealplans_today()
+    result_dict = loads(result)
+
+    # Should have meals organized by type
+    assert "meals" in result_dict
+
+
+def test_get_today_mealplans_empty(mock_client):
+    """Test retrieving today's meals when none exist."""
+    configure(mock_client, get=[])
+
+    result = mealplans_today()
+
+    assert loads(result) == _EMPTY_TODAY
+
+
+# Tests for mealplans_get function
+def test_get_mealplan_by_id(mock_client):
+    """Test retrieving a specific meal plan entry."""
+    mealplan = build_mealplan(
+        meal_date="2025-12-25",
+        entry_type="dinner",
+        title="Holiday Dinner"
+    )
+    mealplan["id"] = "mealplan-123"
+
+    configure(mock_client, get=mealplan)
+
+    result = mealplans_get("mealplan-123")
+    result_dict = loads(result)
+
+    assert result_dict["id"] == "mealplan-123"
+    assert result_dict["title"] == "Holiday Dinner"
+
+    # Verify endpoint
+    mock_client.get.assert_called_once_with("/api/households/mealplans/mealplan-123")
+
+
+# Tests for mealplans_create function
+def test_create_mealplan_with_recipe(mock_client):
+    """Test creating a meal plan entry with recipe."""
+    configure(mock_client, post=build_mealplan(
+        meal_date="2025-12-25",
+        entry_type="dinner",
+        recipeId="recipe-123"
+    ))
+
+    result = mealplans_create(
+        meal_date="2025-12-25",
+        entry_type="dinner",
+        recipe_id="recipe-123"
+    )
+    result_dict = loads(result)
+
+    # Function wraps response with success/entry keys
+    assert result_dict["success"] is True
+    assert "entry" in result_dict
+
+    # Verify POST payload
+    payload = mock_client.post.call_args.kwargs["json"]
+    expected = {"date": "2025-12-25", "entryType": "dinner", "recipeId": "recipe-123"}
+    assert expected.items() <= payload.items()
+
+
+def test_create_mealplan_without_recipe(mock_client):
+    """Test creating a meal plan entry without recipe."""
+    configure(mock_client, post=build_mealplan(
+        meal_date="2025-12-25",
+        entry_type="breakfast",
+        title="Quick breakfast",
+        text="Eggs and toast"
+    ))
+
+    result = mealplans_create(
+        meal_date="2025-12-25",
+        entry_type="breakfast",
+        title="Quick breakfast",
+        text="Eggs and toast"
+    )
+
+    # Should work without recipe_id
+    call_args = mock_client.post.call_args
+    payload = call_args[1]["json"]
+    assert "title" in payload
+    assert "text" in payload
+
+
+@pytest.mark.parametrize("entry_type", ["breakfast", "lunch", "dinner", "side", "snack"])
+def test_create_mealplan_validates_entry_type(mock_client, entry_type):
+    """Test that valid entry types are accepted."""
+    configure(mock_client, post=_MEALPLAN)
+
+    result = mealplans_create(
+        meal_date="2025-12-25",
+        entry_type=entry_type
+    )
+    # Should not raise error
+    assert result is not None
+
+
+# Tests for mealplans_delete function
+def test_delete_mealplan(mock_client):
+    """Test deleting a meal plan entry."""
+    configure(mock_client, delete={"message": "Deleted"})
+
+    result = mealplans_delete("mealplan-123")
+    result_dict = loads(result)
+
+    assert "success" in result_dict or "message" in result_dict
+
+    # Verify DELETE endpoint
+    mock_client.delete.assert_called_once_with("/api/households/mealplans/mealplan-123")
+
+
+# MealieAPIError from the client is reported as an error payload
+@pytest.mark.parametrize("tool, method, args, error", [
+    pytest.param(mealplans_list, "get", (), ERR_500, id="list"),
+    pytest.param(mealplans_get, "get", ("nonexistent",), ERR_404, id="get_not_found"),
+    pytest.param(mealplans_create, "post", ("2025-12-25", "dinner"), ERR_400, id="create"),
+    pytest.param(mealplans_delete, "delete", ("nonexistent",), ERR_404, id="delete_not_found"),
+    pytest.param(mealplans_delete, "delete", ("mealplan-123",), ERR_500, id="delete"),
+])
+def test_api_error(mock_client, tool, method, args, error):
+    """Test the tool returns the error and status code instead of raising."""
+    configure(mock_client, **{f"raise_{method}": error})
+
+    result_dict = loads(tool(*args))
+
+    assert "error" in result_dict
+    assert result_dict["status_code"] == error.status_code
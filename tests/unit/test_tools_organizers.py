@@ -4,9 +4,8 @@ Tests management of tags, categories, and kitchen tools.
 All tests use mocked MealieClient to avoid network calls.
 """
 
-import json
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from src.tools import organizers as organizers_module
 from src.tools.organizers import (
     tags_list,
     tags_create,
@@ -16,328 +15,185 @@ from src.tools.organizers import (
     tools_create
 )
 from tests.unit.builders import build_tag, build_category, build_tool
+from tests.unit.mocks import ERR_409, ERR_500, configure, patch_client
+from tests.unit._json import loads
 
+pytestmark = [pytest.mark.organizers, pytest.mark.xdist_group("tools_organizers")]
 
-class TestTagsList:
-    """Tests for tags_list function."""
 
-    def test_list_all_tags(self):
-        """Test listing all tags."""
-        mock_client = Mock()
-        mock_client.list_tags.return_value = [
-            build_tag(name="Vegan"),
-            build_tag(name="Quick"),
-            build_tag(name="Healthy")
-        ]
+# Builder output shared by the list tests; the tools only serialize it
+_TAGS = [build_tag(name=name) for name in ("Vegan", "Quick", "Healthy")]
+_CATEGORIES = [build_category(name=name) for name in ("Breakfast", "Lunch", "Dinner")]
+_TOOLS = [build_tool(name=name) for name in ("Blender", "Stand Mixer", "Food Processor")]
 
-        with patch('src.tools.organizers.MealieClient') as MockClient:
-            MockClient.return_value.__enter__.return_value = mock_client
+# Full decoded tool output when the server has no organizers
+_NO_TAGS = {"success": True, "tags": []}
+_NO_CATEGORIES = {"success": True, "categories": []}
+_NO_TOOLS = {"success": True, "tools": []}
 
-            result = tags_list()
-            result_dict = json.loads(result)
 
-            # Should have success and tags keys
-            assert result_dict["success"] is True
-            assert len(result_dict["tags"]) == 3
+@pytest.fixture(autouse=True)
+def mock_client(monkeypatch):
+    """Spec'd client mock served to the organizer tools in every test."""
+    return patch_client(monkeypatch, organizers_module)
 
-    def test_list_tags_empty(self):
-        """Test listing tags when none exist."""
-        mock_client = Mock()
-        mock_client.list_tags.return_value = []
 
-        with patch('src.tools.organizers.MealieClient') as MockClient:
-            MockClient.return_value.__enter__.return_value = mock_client
+# Tests for tags_list function
+def test_list_all_tags(mock_client):
+    """Test listing all tags."""
+    configure(mock_client, list_tags=_TAGS)
 
-            result = tags_list()
-            result_dict = json.loads(result)
+    result = tags_list()
+    result_dict = loads(result)
 
-            assert result_dict["success"] is True
-            assert result_dict["tags"] == []
+    # Should have success and tags keys
+    assert result_dict["success"] is True
+    assert len(result_dict["tags"]) == 3
 
-    def test_list_tags_api_error(self):
-        """Test handling of API error during tags list."""
-        from src.client import MealieAPIError
 
-        mock_client = Mock()
-        mock_client.list_tags.side_effect = MealieAPIError(
-            "Failed to fetch",
-            status_code=500,
-            response_body="Server error"
-        )
+def test_list_tags_empty(mock_client):
+    """Test listing tags when none exist."""
+    configure(mock_client, list_tags=[])
 
-        with patch('src.tools.organizers.MealieClient') as MockClient:
-            MockClient.return_value.__enter__.return_value = mock_client
+    result = tags_list()
 
-            result = tags_list()
-            result_dict = json.loads(result)
+    assert loads(result) == _NO_TAGS
 
-            assert "error" in result_dict
 
+# Tests for tags_create function
+def test_create_tag(mock_client):
+    """Test creating a new tag."""
+    configure(mock_client, create_tag=build_tag(name="Gluten Free"))
 
-class TestTagsCreate:
-    """Tests for tags_create function."""
+    result = tags_create(name="Gluten Free")
+    result_dict = loads(result)
 
-    def test_create_tag(self):
-        """Test creating a new tag."""
-        mock_client = Mock()
-        mock_client.create_tag.return_value = build_tag(name="Gluten Free")
+    assert result_dict["success"] is True
+    assert result_dict["tag"]["name"] == "Gluten Free"
 
-        with patch('src.tools.organizers.MealieClient') as MockClient:
-            MockClient.return_value.__enter__.return_value = mock_client
 
-            result = tags_create(name="Gluten Free")
-            result_dict = json.loads(result)
+def test_create_tag_generates_slug(mock_client):
+    """Test that tag creation generates slug from name."""
+    configure(mock_client, create_tag=build_tag(
+        name="Gluten Free",
+        slug="gluten-free"
+    ))
 
-            assert result_dict["success"] is True
-            assert result_dict["tag"]["name"] == "Gluten Free"
+    result = tags_create(name="Gluten Free")
+    result_dict = loads(result)
 
-    def test_create_tag_generates_slug(self):
-        """Test that tag creation generates slug from name."""
-        mock_client = Mock()
-        mock_client.create_tag.return_value = build_tag(
-            name="Gluten Free",
-            slug="gluten-free"
-        )
+    assert result_dict["tag"]["slug"] == "gluten-free"
 
-        with patch('src.tools.organizers.MealieClient') as MockClient:
-            MockClient.return_value.__enter__.return_value = mock_client
 
-            result = tags_create(name="Gluten Free")
-            result_dict = json.loads(result)
+# Tests for categories_list function
+def test_list_all_categories(mock_client):
+    """Test listing all categories."""
+    configure(mock_client, list_categories=_CATEGORIES)
 
-            assert result_dict["tag"]["slug"] == "gluten-free"
+    result = categories_list()
+    result_dict = loads(result)
 
-    def test_create_tag_duplicate_error(self):
-        """Test handling of duplicate tag error."""
-        from src.client import MealieAPIError
+    assert result_dict["success"] is True
+    assert len(result_dict["categories"]) == 3
 
-        mock_client = Mock()
-        mock_client.create_tag.side_effect = MealieAPIError(
-            "Tag already exists",
-            status_code=409,
-            response_body="Duplicate tag"
-        )
 
-        with patch('src.tools.organizers.MealieClient') as MockClient:
-            MockClient.return_value.__enter__.return_value = mock_client
+def test_list_categories_empty(mock_client):
+    """Test listing categories when none exist."""
+    configure(mock_client, list_categories=[])
 
-            result = tags_create(name="Existing Tag")
-            result_dict = json.loads(result)
+    result = categories_list()
 
-            assert "error" in result_dict
+    assert loads(result) == _NO_CATEGORIES
 
 
-class TestCategoriesList:
-    """Tests for categories_list function."""
+# Tests for categories_create function
+def test_create_category(mock_client):
+    """Test creating a new category."""
+    configure(mock_client, create_category=build_category(name="Appetizers"))
 
-    def test_list_all_categories(self):
-        """Test listing all categories."""
-        mock_client = Mock()
-        mock_client.list_categories.return_value = [
-            build_category(name="Breakfast"),
-            build_category(name="Lunch"),
-            build_category(name="Dinner")
-        ]
+    result = categories_create(name="Appetizers")
+    result_dict = loads(result)
 
-        with patch('src.tools.organizers.MealieClient') as MockClient:
-            MockClient.return_value.__enter__.return_value = mock_client
+    assert result_dict["success"] is True
+    assert result_dict["category"]["name"] == "Appetizers"
 
-            result = categories_list()
-            result_dict = json.loads(result)
 
-            assert result_dict["success"] is True
-            assert len(result_dict["categories"]) == 3
+def test_create_category_generates_slug(mock_client):
+    """Test that category creation generates slug from name."""
+    configure(mock_client, create_category=build_category(
+        name="Side Dishes",
+        slug="side-dishes"
+    ))
 
-    def test_list_categories_empty(self):
-        """Test listing categories when none exist."""
-        mock_client = Mock()
-        mock_client.list_categories.return_value = []
+    result = categories_create(name="Side Dishes")
+    result_dict = loads(result)
 
-        with patch('src.tools.organizers.MealieClient') as MockClient:
-            MockClient.return_value.__enter__.return_value = mock_client
+    assert result_dict["category"]["slug"] == "side-dishes"
 
-            result = categories_list()
-            result_dict = json.loads(result)
 
-            assert result_dict["success"] is True
-            assert result_dict["categories"] == []
+# Tests for tools_list function
+def test_list_all_tools(mock_client):
+    """Test listing all kitchen tools."""
+    configure(mock_client, list_tools=_TOOLS)
 
-    def test_list_categories_api_error(self):
-        """Test handling of API error during categories list."""
-        from src.client import MealieAPIError
+    result = tools_list()
+    result_dict = loads(result)
 
-        mock_client = Mock()
-        mock_client.list_categories.side_effect = MealieAPIError(
-            "Failed to fetch",
-            status_code=500,
-            response_body="Server error"
-        )
+    assert result_dict["success"] is True
+    assert len(result_dict["tools"]) == 3
 
-        with patch('src.tools.organizers.MealieClient') as MockClient:
-            MockClient.return_value.__enter__.return_value = mock_client
 
-            result = categories_list()
-            result_dict = json.loads(result)
+def test_list_tools_empty(mock_client):
+    """Test listing tools when none exist."""
+    configure(mock_client, list_tools=[])
 
-            assert "error" in result_dict
+    result = tools_list()
 
+    assert loads(result) == _NO_TOOLS
 
-class TestCategoriesCreate:
-    """Tests for categories_create function."""
 
-    def test_create_category(self):
-        """Test creating a new category."""
-        mock_client = Mock()
-        mock_client.create_category.return_value = build_category(name="Appetizers")
+# Tests for tools_create function
+def test_create_tool(mock_client):
+    """Test creating a new kitchen tool."""
+    configure(mock_client, create_tool=build_tool(name="Slow Cooker"))
 
-        with patch('src.tools.organizers.MealieClient') as MockClient:
-            MockClient.return_value.__enter__.return_value = mock_client
+    result = tools_create(name="Slow Cooker")
+    result_dict = loads(result)
 
-            result = categories_create(name="Appetizers")
-            result_dict = json.loads(result)
+    assert result_dict["success"] is True
+    assert result_dict["tool"]["name"] == "Slow Cooker"
 
-            assert result_dict["success"] is True
-            assert result_dict["category"]["name"] == "Appetizers"
 
-    def test_create_category_generates_slug(self):
-        """Test that category creation generates slug from name."""
-        mock_client = Mock()
-        mock_client.create_category.return_value = build_category(
-            name="Side Dishes",
-            slug="side-dishes"
-        )
+def test_create_tool_generates_slug(mock_client):
+    """Test that tool creation generates slug from name."""
+    configure(mock_client, create_tool=build_tool(
+        name="Instant Pot",
+        slug="instant-pot"
+    ))
 
-        with patch('src.tools.organizers.MealieClient') as MockClient:
-            MockClient.return_value.__enter__.return_value = mock_client
+    result = tools_create(name="Instant Pot")
+    result_dict = loads(result)
 
-            result = categories_create(name="Side Dishes")
-            result_dict = json.loads(result)
+    assert result_dict["tool"]["slug"] == "instant-pot"
 
-            assert result_dict["category"]["slug"] == "side-dishes"
 
-    def test_create_category_duplicate_error(self):
-        """Test handling of duplicate category error."""
-        from src.client import MealieAPIError
+# MealieAPIError from the client is reported as an error payload
+@pytest.mark.parametrize("tool, method, args, error", [
+    pytest.param(tags_list, "list_tags", (), ERR_500, id="tags_list"),
+    pytest.param(tags_create, "create_tag", ("Existing Tag",), ERR_409, id="tags_create_duplicate"),
+    pytest.param(categories_list, "list_categories", (), ERR_500, id="categories_list"),
+    pytest.param(
+        categories_create, "create_category", ("Existing Category",), ERR_409,
+        id="categories_create_duplicate"
+    ),
+    pytest.param(tools_list, "list_tools", (), ERR_500, id="tools_list"),
+    pytest.param(tools_create, "create_tool", ("Existing Tool",), ERR_409, id="tools_create_duplicate"),
+])
+def test_api_error(mock_client, tool, method, args, error):
+    """Test the tool returns the error and status code instead of raising."""
+    configure(mock_client, **{f"raise_{method}": error})
 
-        mock_client = Mock()
-        mock_client.create_category.side_effect = MealieAPIError(
-            "Category already exists",
-            status_code=409,
-            response_body="Duplicate category"
-        )
+    result_dict = loads(tool(*args))
 
-        with patch('src.tools.organizers.MealieClient') as MockClient:
-            MockClient.return_value.__enter__.return_value = mock_client
-
-            result = categories_create(name="Existing Category")
-            result_dict = json.loads(result)
-
-            assert "error" in result_dict
-
-
-class TestToolsList:
-    """Tests for tools_list function."""
-
-    def test_list_all_tools(self):
-        """Test listing all kitchen tools."""
-        mock_client = Mock()
-        mock_client.list_tools.return_value = [
-            build_tool(name="Blender"),
-            build_tool(name="Stand Mixer"),
-            build_tool(name="Food Processor")
-        ]
-
-        with patch('src.tools.organizers.MealieClient') as MockClient:
-            MockClient.return_value.__enter__.return_value = mock_client
-
-            result = tools_list()
-            result_dict = json.loads(result)
-
-            assert result_dict["success"] is True
-            assert len(result_dict["tools"]) == 3
-
-    def test_list_tools_empty(self):
-        """Test listing tools when none exist."""
-        mock_client = Mock()
-        mock_client.list_tools.return_value = []
-
-        with patch('src.tools.organizers.MealieClient') as MockClient:
-            MockClient.return_value.__enter__.return_value = mock_client
-
-            result = tools_list()
-            result_dict = json.loads(result)
-
-            assert result_dict["success"] is True
-            assert result_dict["tools"] == []
-
-    def test_list_tools_api_error(self):
-        """Test handling of API error during tools list."""
-        from src.client import MealieAPIError
-
-        mock_client = Mock()
-        mock_client.list_tools.side_effect = MealieAPIError(
-            "Failed to fetch",
-            status_code=500,
-            response_body="Server error"
-        )
-
-        with patch('src.tools.organizers.MealieClient') as MockClient:
-            MockClient.return_value.__enter__.return_value = mock_client
-
-            result = tools_list()
-            result_dict = json.loads(result)
-
-            assert "error" in result_dict
-
-
-class TestToolsCreate:
-    """Tests for tools_create function."""
-
-    def test_create_tool(self):
-        """Test creating a new kitchen tool."""
-        mock_client = Mock()
-        mock_client.create_tool.return_value = build_tool(name="Slow Cooker")
-
-        with patch('src.tools.organizers.MealieClient') as MockClient:
-            MockClient.return_value.__enter__.return_value = mock_client
-
-            result = tools_create(name="Slow Cooker")
-            result_dict = json.loads(result)
-
-            assert result_dict["success"] is True
-            assert result_dict["tool"]["name"] == "Slow Cooker"
-
-    def test_create_tool_generates_slug(self):
-        """Test that tool creation generates slug from name."""
-        mock_client = Mock()
-        mock_client.create_tool.return_value = build_tool(
-            name="Instant Pot",
-            slug="instant-pot"
-        )
-
-        with patch('src.tools.organizers.MealieClient') as MockClient:
-            MockClient.return_value.__enter__.return_value = mock_client
-
-            result = tools_create(name="Instant Pot")
-            result_dict = json.loads(result)
-
-            assert result_dict["tool"]["slug"] == "instant-pot"
-
-    def test_create_tool_duplicate_error(self):
-        """Test handling of duplicate tool error."""
-        from src.client import MealieAPIError
-
-        mock_client = Mock()
-        mock_client.create_tool.side_effect = MealieAPIError(
-            "Tool already exists",
-            status_code=409,
-            response_body="Duplicate tool"
-        )
-
-        with patch('src.tools.organizers.MealieClient') as MockClient:
-            MockClient.return_value.__enter__.return_value = mock_client
-
-            result = tools_create(name="Existing Tool")
-            result_dict = json.loads(result)
-
-            assert "error" in result_dict
+    assert "error" in result_dict
+    assert result_dict["status_code"] == error.status_code
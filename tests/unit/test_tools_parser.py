@@ -4,106 +4,70 @@ Tests ingredient parsing functionality including single and batch parsing,
 edge cases, and error handling. All tests use mocked MealieClient.
 """
 
-import json
 import pytest
-from unittest.mock import Mock
+from src.tools import parser as parser_module
 from src.tools.parser import parser_ingredient, parser_ingredients_batch
 from tests.unit.builders import build_parsed_ingredient
+from tests.unit.mocks import ERR_400, ERR_500, StubParserClient
+from tests.unit._json import loads
 
+pytestmark = [
+    pytest.mark.xdist_group("tools_parser"),
+    pytest.mark.filterwarnings("error"),
+]
 
-class TestParserIngredient:
-    """Tests for single ingredient parsing."""
+# Canonical parser responses, built once; the tools only serialise them
+_FLOUR_2C = build_parsed_ingredient("2 cups flour", 2.0, "cup", "flour")
+_SUGAR_HALF_C = build_parsed_ingredient("1/2 cup sugar", 0.5, "cup", "sugar")
+_SALT_1TSP = build_parsed_ingredient("1 tsp salt", 1.0, "teaspoon", "salt")
+_BUTTER_HALF_C = build_parsed_ingredient("1/2 cup butter", 0.5, "cup", "butter")
+_BATCH_3 = [_FLOUR_2C, _SALT_1TSP, _BUTTER_HALF_C]
 
-    def test_parse_simple_ingredient(self):
-        """Test parsing a simple ingredient string."""
-        # Mock client
-        mock_client = Mock()
-        mock_client.parse_ingredient.return_value = build_parsed_ingredient(
-            input_text="2 cups flour",
-            quantity=2.0,
-            unit="cup",
-            food="flour"
-        )
+@pytest.fixture(scope="session")
+def _shared_stub():
+    """One StubParserClient for the session; reset before every test."""
+    return StubParserClient()
 
-        # Patch MealieClient in the module
-        from src.tools import parser
-        original_client = parser.MealieClient
-        parser.MealieClient = Mock(return_value=mock_client)
-        mock_client.__enter__ = Mock(return_value=mock_client)
-        mock_client.__exit__ = Mock(return_value=False)
-
-        try:
-            result = parser_ingredient("2 cups flour")
-            result_dict = json.loads(result)
-
-            # Verify structure
-            assert "input" in result_dict
-            assert "ingredient" in result_dict
-            assert "confidence" in result_dict
-
-            # Verify values
-            assert result_dict["input"] == "2 cups flour"
-            assert result_dict["ingredient"]["quantity"] == 2.0
-            assert result_dict["ingredient"]["unit"]["name"] == "cup"
-            assert result_dict["ingredient"]["food"]["name"] == "flour"
-        finally:
-            parser.MealieClient = original_client
-
-    def test_parse_ingredient_with_fraction(self):
-        """Test parsing ingredient with fractional quantity."""
-        mock_client = Mock()
-        mock_client.parse_ingredient.return_value = build_parsed_ingredient(
-            input_text="1/2 cup sugar",
-            quantity=0.5,
-            unit="cup",
-            food="sugar"
-        )
 
-        from src.tools import parser
-        original_client = parser.MealieClient
-        parser.MealieClient = Mock(return_value=mock_client)
-        mock_client.__enter__ = Mock(return_value=mock_client)
-        mock_client.__exit__ = Mock(return_value=False)
-
-        try:
-            result = parser_ingredient("1/2 cup sugar")
-            result_dict = json.loads(result)
-
-            assert result_dict["ingredient"]["quantity"] == 0.5
-            assert result_dict["ingredient"]["unit"]["name"] == "cup"
-            assert result_dict["ingredient"]["food"]["name"] == "sugar"
-        finally:
-            parser.MealieClient = original_client
-
-    def test_parse_ingredient_with_teaspoon(self):
-        """Test parsing ingredient with teaspoon measurement."""
-        mock_client = Mock()
-        mock_client.parse_ingredient.return_value = build_parsed_ingredient(
-            input_text="1 tsp salt",
-            quantity=1.0,
-            unit="teaspoon",
-            food="salt"
-        )
+@pytest.fixture(autouse=True)
+def mock_parser_client(_shared_stub, monkeypatch):
+    """Patch the parser module's MealieClient with the reset shared stub.
 
-        from src.tools import parser
-        original_client = parser.MealieClient
-        parser.MealieClient = Mock(return_value=mock_client)
-        mock_client.__enter__ = Mock(return_value=mock_client)
-        mock_client.__exit__ = Mock(return_value=False)
+    monkeypatch restores the real class after each test, so tests only set
+    results on the returned stub.
+    """
+    _shared_stub.reset()
+    monkeypatch.setattr(parser_module, "MealieClient", lambda: _shared_stub)
+    return _shared_stub
 
-        try:
-            result = parser_ingredient("1 tsp salt")
-            result_dict = json.loads(result)
 
-            assert result_dict["ingredient"]["quantity"] == 1.0
-            assert "teaspoon" in result_dict["ingredient"]["unit"]["name"].lower() or \
-                   "tsp" in result_dict["ingredient"]["unit"]["name"].lower()
-        finally:
-            parser.MealieClient = original_client
+class TestParserIngredient:
+    """Tests for single ingredient parsing."""
 
-    def test_parse_ingredient_with_note(self):
+    @pytest.mark.parametrize("text, parsed", [
+        pytest.param("2 cups flour", _FLOUR_2C, id="simple"),
+        pytest.param("1/2 cup sugar", _SUGAR_HALF_C, id="fraction"),
+        pytest.param("1 tsp salt", _SALT_1TSP, id="teaspoon"),
+        pytest.param("", build_parsed_ingredient("", 0.0, "", ""), id="empty_string"),
+        # Parser might average the range
+        pytest.param(
+            "2-3 cups flour",
+            build_parsed_ingredient("2-3 cups flour", 2.5, "cup", "flour"),
+            id="range"
+        ),
+    ])
+    def test_parse_ingredient(self, mock_parser_client, text, parsed):
+        """Test the parsed ingredient is returned unchanged for the input text."""
+        mock_parser_client.results["parse_ingredient"] = parsed
+
+        result = parser_ingredient(text)
+        result_dict = loads(result)
+
+        assert result_dict["input"] == text
+        assert result_dict == parsed
+
+    def test_parse_ingredient_with_note(self, mock_parser_client):
         """Test parsing ingredient with additional notes."""
-        mock_client = Mock()
         parsed = build_parsed_ingredient(
             input_text="2 cups flour, sifted",
             quantity=2.0,
@@ -111,268 +75,88 @@ class TestParserIngredient:
             food="flour"
         )
         parsed["ingredient"]["note"] = "sifted"
-        mock_client.parse_ingredient.return_value = parsed
-
-        from src.tools import parser
-        original_client = parser.MealieClient
-        parser.MealieClient = Mock(return_value=mock_client)
-        mock_client.__enter__ = Mock(return_value=mock_client)
-        mock_client.__exit__ = Mock(return_value=False)
+        mock_parser_client.results["parse_ingredient"] = parsed
 
-        try:
-            result = parser_ingredient("2 cups flour, sifted")
-            result_dict = json.loads(result)
+        result = parser_ingredient("2 cups flour, sifted")
+        result_dict = loads(result)
 
-            assert result_dict["ingredient"]["quantity"] == 2.0
-            assert result_dict["ingredient"]["note"] == "sifted"
-        finally:
-            parser.MealieClient = original_client
+        assert result_dict["ingredient"]["quantity"] == 2.0
+        assert result_dict["ingredient"]["note"] == "sifted"
 
-    def test_parse_ingredient_with_brute_parser(self):
+    def test_parse_ingredient_with_brute_parser(self, mock_parser_client):
         """Test parsing with brute force parser."""
-        mock_client = Mock()
-        mock_client.parse_ingredient.return_value = build_parsed_ingredient()
-
-        from src.tools import parser
-        original_client = parser.MealieClient
-        parser.MealieClient = Mock(return_value=mock_client)
-        mock_client.__enter__ = Mock(return_value=mock_client)
-        mock_client.__exit__ = Mock(return_value=False)
-
-        try:
-            result = parser_ingredient("2 cups flour", parser="brute")
-
-            # Verify parser parameter was passed
-            mock_client.parse_ingredient.assert_called_once_with(
-                ingredient="2 cups flour",
-                parser="brute"
-            )
-        finally:
-            parser.MealieClient = original_client
-
-    def test_parse_ingredient_empty_string(self):
-        """Test parsing empty ingredient string."""
-        mock_client = Mock()
-        mock_client.parse_ingredient.return_value = build_parsed_ingredient(
-            input_text="",
-            quantity=0.0,
-            unit="",
-            food=""
-        )
-
-        from src.tools import parser
-        original_client = parser.MealieClient
-        parser.MealieClient = Mock(return_value=mock_client)
-        mock_client.__enter__ = Mock(return_value=mock_client)
-        mock_client.__exit__ = Mock(return_value=False)
-
-        try:
-            result = parser_ingredient("")
-            result_dict = json.loads(result)
-
-            assert "ingredient" in result_dict
-        finally:
-            parser.MealieClient = original_client
-
-    def test_parse_ingredient_api_error(self):
-        """Test handling of API error during parsing."""
-        from src.client import MealieAPIError
-
-        mock_client = Mock()
-        mock_client.parse_ingredient.side_effect = MealieAPIError(
-            "Parser error",
-            status_code=400,
-            response_body="Invalid ingredient format"
-        )
-
-        from src.tools import parser
-        original_client = parser.MealieClient
-        parser.MealieClient = Mock(return_value=mock_client)
-        mock_client.__enter__ = Mock(return_value=mock_client)
-        mock_client.__exit__ = Mock(return_value=False)
-
-        try:
-            result = parser_ingredient("invalid")
-            result_dict = json.loads(result)
-
-            assert "error" in result_dict
-            assert result_dict["status_code"] == 400
-        finally:
-            parser.MealieClient = original_client
-
-    def test_parse_ingredient_with_range(self):
-        """Test parsing ingredient with quantity range."""
-        mock_client = Mock()
-        mock_client.parse_ingredient.return_value = build_parsed_ingredient(
-            input_text="2-3 cups flour",
-            quantity=2.5,  # Parser might average the range
-            unit="cup",
-            food="flour"
-        )
+        mock_parser_client.results["parse_ingredient"] = _FLOUR_2C
 
-        from src.tools import parser
-        original_client = parser.MealieClient
-        parser.MealieClient = Mock(return_value=mock_client)
-        mock_client.__enter__ = Mock(return_value=mock_client)
-        mock_client.__exit__ = Mock(return_value=False)
+        parser_ingredient("2 cups flour", parser="brute")
 
-        try:
-            result = parser_ingredient("2-3 cups flour")
-            result_dict = json.loads(result)
-
-            assert result_dict["ingredient"]["quantity"] > 0
-            assert result_dict["ingredient"]["food"]["name"] == "flour"
-        finally:
-            parser.MealieClient = original_client
+        # Verify parser parameter was passed
+        assert mock_parser_client.calls == [
+            ("parse_ingredient", {"ingredient": "2 cups flour", "parser": "brute"})
+        ]
 
 
 class TestParserIngredientsBatch:
     """Tests for batch ingredient parsing."""
 
-    def test_parse_multiple_ingredients(self):
-        """Test parsing a batch of ingredients."""
-        mock_client = Mock()
-        mock_client.parse_ingredients_batch.return_value = [
-            build_parsed_ingredient("2 cups flour", 2.0, "cup", "flour"),
-            build_parsed_ingredient("1 tsp salt", 1.0, "teaspoon", "salt"),
-            build_parsed_ingredient("1/2 cup butter", 0.5, "cup", "butter")
-        ]
-
-        from src.tools import parser
-        original_client = parser.MealieClient
-        parser.MealieClient = Mock(return_value=mock_client)
-        mock_client.__enter__ = Mock(return_value=mock_client)
-        mock_client.__exit__ = Mock(return_value=False)
-
-        try:
-            ingredients = ["2 cups flour", "1 tsp salt", "1/2 cup butter"]
-            result = parser_ingredients_batch(ingredients)
-            result_dict = json.loads(result)
-
-            assert "count" in result_dict
-            assert "parsed_ingredients" in result_dict
-            assert result_dict["count"] == 3
-            assert len(result_dict["parsed_ingredients"]) == 3
-        finally:
-            parser.MealieClient = original_client
-
-    def test_parse_batch_empty_list(self):
-        """Test parsing empty ingredient list."""
-        mock_client = Mock()
-        mock_client.parse_ingredients_batch.return_value = []
-
-        from src.tools import parser
-        original_client = parser.MealieClient
-        parser.MealieClient = Mock(return_value=mock_client)
-        mock_client.__enter__ = Mock(return_value=mock_client)
-        mock_client.__exit__ = Mock(return_value=False)
-
-        try:
-            result = parser_ingredients_batch([])
-            result_dict = json.loads(result)
-
-            assert result_dict["count"] == 0
-            assert result_dict["parsed_ingredients"] == []
-        finally:
-            parser.MealieClient = original_client
-
-    def test_parse_batch_single_ingredient(self):
-        """Test batch parsing with single ingredient."""
-        mock_client = Mock()
-        mock_client.parse_ingredients_batch.return_value = [
-            build_parsed_ingredient("2 cups flour", 2.0, "cup", "flour")
-        ]
+    @pytest.mark.parametrize("inputs, returns", [
+        pytest.param([], [], id="empty"),
+        pytest.param(["2 cups flour"], [_FLOUR_2C], id="single"),
+        pytest.param(["2 cups flour", "1 tsp salt", "1/2 cup butter"], _BATCH_3, id="three"),
+    ])
+    def test_parse_batch(self, mock_parser_client, inputs, returns):
+        """Test the batch result counts and returns every parsed ingredient."""
+        mock_parser_client.results["parse_ingredients_batch"] = returns
 
-        from src.tools import parser
-        original_client = parser.MealieClient
-        parser.MealieClient = Mock(return_value=mock_client)
-        mock_client.__enter__ = Mock(return_value=mock_client)
-        mock_client.__exit__ = Mock(return_value=False)
+        result = parser_ingredients_batch(inputs)
+        result_dict = loads(result)
 
-        try:
-            result = parser_ingredients_batch(["2 cups flour"])
-            result_dict = json.loads(result)
+        assert result_dict["count"] == len(inputs)
+        assert result_dict["parsed_ingredients"] == returns
 
-            assert result_dict["count"] == 1
-        finally:
-            parser.MealieClient = original_client
-
-    def test_parse_batch_with_different_parser(self):
+    def test_parse_batch_with_different_parser(self, mock_parser_client):
         """Test batch parsing with alternative parser."""
-        mock_client = Mock()
-        mock_client.parse_ingredients_batch.return_value = [
-            build_parsed_ingredient("2 cups flour", 2.0, "cup", "flour")
-        ]
-
-        from src.tools import parser
-        original_client = parser.MealieClient
-        parser.MealieClient = Mock(return_value=mock_client)
-        mock_client.__enter__ = Mock(return_value=mock_client)
-        mock_client.__exit__ = Mock(return_value=False)
-
-        try:
-            result = parser_ingredients_batch(["2 cups flour"], parser="brute")
-
-            # Verify parser parameter was passed
-            mock_client.parse_ingredients_batch.assert_called_once_with(
-                ingredients=["2 cups flour"],
-                parser="brute"
-            )
-        finally:
-            parser.MealieClient = original_client
-
-    def test_parse_batch_api_error(self):
-        """Test handling of API error during batch parsing."""
-        from src.client import MealieAPIError
-
-        mock_client = Mock()
-        mock_client.parse_ingredients_batch.side_effect = MealieAPIError(
-            "Batch parser error",
-            status_code=500,
-            response_body="Internal server error"
-        )
+        mock_parser_client.results["parse_ingredients_batch"] = [_FLOUR_2C]
 
-        from src.tools import parser
-        original_client = parser.MealieClient
-        parser.MealieClient = Mock(return_value=mock_client)
-        mock_client.__enter__ = Mock(return_value=mock_client)
-        mock_client.__exit__ = Mock(return_value=False)
+        parser_ingredients_batch(["2 cups flour"], parser="brute")
 
-        try:
-            result = parser_ingredients_batch(["2 cups flour"])
-            result_dict = json.loads(result)
-
-            assert "error" in result_dict
-            assert result_dict["status_code"] == 500
-        finally:
-            parser.MealieClient = original_client
+        # Verify parser parameter was passed
+        assert mock_parser_client.calls == [
+            ("parse_ingredients_batch", {"ingredients": ["2 cups flour"], "parser": "brute"})
+        ]
 
-    def test_parse_batch_mixed_formats(self):
+    def test_parse_batch_mixed_formats(self, mock_parser_client):
         """Test parsing ingredients with mixed formats."""
-        mock_client = Mock()
-        mock_client.parse_ingredients_batch.return_value = [
-            build_parsed_ingredient("2 cups flour", 2.0, "cup", "flour"),
+        mock_parser_client.results["parse_ingredients_batch"] = [
+            _FLOUR_2C,
             build_parsed_ingredient("salt to taste", 0.0, "", "salt"),
             build_parsed_ingredient("3 large eggs", 3.0, "large", "eggs")
         ]
 
-        from src.tools import parser
-        original_client = parser.MealieClient
-        parser.MealieClient = Mock(return_value=mock_client)
-        mock_client.__enter__ = Mock(return_value=mock_client)
-        mock_client.__exit__ = Mock(return_value=False)
-
-        try:
-            ingredients = ["2 cups flour", "salt to taste", "3 large eggs"]
-            result = parser_ingredients_batch(ingredients)
-            result_dict = json.loads(result)
-
-            assert result_dict["count"] == 3
-
-            # Verify each ingredient was parsed
-            parsed = result_dict["parsed_ingredients"]
-            assert parsed[0]["ingredient"]["food"]["name"] == "flour"
-            assert parsed[1]["ingredient"]["food"]["name"] == "salt"
-            assert parsed[2]["ingredient"]["food"]["name"] == "eggs"
-        finally:
-            parser.MealieClient = original_client
+        ingredients = ["2 cups flour", "salt to taste", "3 large eggs"]
+        result = parser_ingredients_batch(ingredients)
+        result_dict = loads(result)
+
+        assert result_dict["count"] == 3
+
+        # Verify each ingredient was parsed
+        parsed = result_dict["parsed_ingredients"]
+        assert parsed[0]["ingredient"]["food"]["name"] == "flour"
+        assert parsed[1]["ingredient"]["food"]["name"] == "salt"
+        assert parsed[2]["ingredient"]["food"]["name"] == "eggs"
+
+
+class TestParserApiErrors:
+    """MealieAPIError from the client is reported as an error payload."""
+
+    @pytest.mark.parametrize("tool, args, error", [
+        pytest.param(parser_ingredient, ("invalid",), ERR_400, id="single"),
+        pytest.param(parser_ingredients_batch, (["2 cups flour"],), ERR_500, id="batch"),
+    ])
+    def test_api_error(self, mock_parser_client, tool, args, error):
+        """Test the tool returns the error and status code instead of raising."""
+        mock_parser_client.raises = error
+
+        result_dict = loads(tool(*args))
+
+        assert "error" in result_dict
+        assert result_dict["status_code"] == error.status_code
@@ -5,13 +5,11 @@ Tests tool wrapper functions in isolation using mocked MealieClient.
 No real HTTP calls or MCP protocol interaction.
 """
 
-import pytest
 import json
 from unittest.mock import Mock, patch
 from src.tools import recipes
 
 
-@pytest.mark.unit
 def test_search_tool_success(sample_recipe_response: dict):
     """Test mealie_recipes_search tool function."""
     # Arrange
@@ -39,7 +37,6 @@ def test_search_tool_success(sample_recipe_response: dict):
         )
 
 
-@pytest.mark.unit
 def test_get_recipe_tool_success(sample_recipe_response: dict):
     """Test mealie_recipes_get tool function."""
     # Arrange
@@ -58,7 +55,6 @@ def test_get_recipe_tool_success(sample_recipe_response: dict):
         mock_client.get_recipe.assert_called_once_with("test-recipe")
 
 
-@pytest.mark.unit
 def test_create_recipe_tool_success(sample_recipe_response: dict):
     """Test mealie_recipes_create tool function."""
     # Arrange
@@ -83,7 +79,6 @@ def test_create_recipe_tool_success(sample_recipe_response: dict):
         mock_client.create_recipe.assert_called_once()
 
 
-@pytest.mark.unit
 def test_update_recipe_tool_success(sample_recipe_response: dict):
     """Test mealie_recipes_update tool function."""
     # Arrange
@@ -109,7 +104,6 @@ def test_update_recipe_tool_success(sample_recipe_response: dict):
         )
 
 
-@pytest.mark.unit
 def test_delete_recipe_tool_success():
     """Test mealie_recipes_delete tool function."""
     # Arrange
@@ -128,7 +122,6 @@ def test_delete_recipe_tool_success():
         mock_client.delete_recipe.assert_called_once_with("test-recipe")
 
 
-@pytest.mark.unit
 def test_tool_error_handling():
     """Test tool function error handling."""
     # Arrange
@@ -147,7 +140,6 @@ def test_tool_error_handling():
         assert "API Error" in result_data["error"]
 
 
-@pytest.mark.unit
 def test_tool_json_serialization(sample_recipe_response: dict):
     """Test that tool results are properly JSON serialized."""
     # Arrange